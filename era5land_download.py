@@ -1,35 +1,68 @@
 # coding=utf-8
 
 
-import os
+import time
 import hidrocl
 import pandas as pd
 import hidrocl_paths as hcl
 
-files = os.listdir(hcl.era5_land_hourly_path)
+files = hidrocl.download.list_downloaded(hcl.era5_land_hourly_path, '.nc')
 
 start = '2000-01-01'
 end = '2022-10-01'
+in_flight_limit = 16
+poll_seconds = 30
 
 p = pd.period_range(pd.to_datetime(start, format="%Y-%m-%d"),
-                    pd.to_datetime(end, format="%Y-%m-%d"), freq='D')
+                    pd.to_datetime(end, format="%Y-%m-%d"), freq='M')
 
+pending = []
 for i in p:
-    print(i)
+    days = pd.period_range(i.start_time, i.end_time, freq='D')
+    fnames = {f'era5-land_{day.year:04d}{day.month:02d}{day.day:02d}.nc' for day in days}
 
-    year = int(i.strftime('%Y'))
-    month = int(i.strftime('%m'))
-    day = int(i.strftime('%d'))
+    if fnames <= files:
+        print(f'{i} already downloaded')
+        continue
 
-    fname = f'era5-land_{year:04d}{month:02d}{day:02d}.nc'
-    if fname in files:
-        print('already downloaded')
-    else:
+    pending.append((i, fnames))
+
+in_flight = []
+failed = []
+while pending or in_flight:
+    while pending and len(in_flight) < in_flight_limit:
+        i, fnames = pending.pop(0)
+        try:
+            in_flight.append((i, fnames, hidrocl.download.submit_era5land_month(i.year, i.month)))
+            print(f'{i} submitted')
+        except Exception as err:
+            print(f'{i} could not be submitted: {err}')
+            failed.append(i)
+
+    if not in_flight:
+        continue
+
+    time.sleep(poll_seconds)
+
+    still_running = []
+    for i, fnames, result in in_flight:
+        # one failed month does not stop the download of the others
         try:
-            print('downloading')
-            hidrocl.download.download_era5land(year=year,
-                                               month=month,
-                                               day=day,
-                                               path=hcl.era5_land_hourly_path)
-        except Exception:
-            print('day out of range')
+            result.update()
+            match result.reply['state']:
+                case 'completed':
+                    hidrocl.download.save_era5land_month(result, hcl.era5_land_hourly_path)
+                    files.update(fnames)
+                    print(f'{i} downloaded')
+                case 'failed':
+                    print(f'{i} failed in CDS')
+                    failed.append(i)
+                case _:
+                    still_running.append((i, fnames, result))
+        except Exception as err:
+            print(f'{i} failed: {err}')
+            failed.append(i)
+    in_flight = still_running
+
+if failed:
+    print('Months not downloaded: ' + ', '.join(str(i) for i in failed))
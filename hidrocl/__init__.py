@@ -1,5 +1,6 @@
 # coding=utf-8
 from __future__ import absolute_import
+import importlib
 from ._version import __version__
 
 __title__ = "hidrocl"
@@ -12,12 +13,49 @@ __email__ = "aatapia@userena.cl"
 __license__ = "MIT"
 __copyright__ = "2022 Aldo Tapia"
 
-try:
-    # from . import variables, products
-    from . import download
-    from .variables import HidroCLVariable
-    from .products import Mod13q1, Mod10a2, Mod16a2, Mcd15a2h,\
-        Gpm_3imrghhl, Gldas_noah, Persiann_ccs, Persiann_ccs_cdr, \
-        Era5_land, ImergGIS, Gfs, Pdirnow
-except ImportError:
-    print("ImportError")
+_LAZY_MODULES = ('download', 'variables', 'products')
+
+_LAZY_ATTRIBUTES = {
+    'HidroCLVariable': 'variables',
+    'Mod13q1': 'products',
+    'Mod10a2': 'products',
+    'Mod16a2': 'products',
+    'Mcd15a2h': 'products',
+    'Gpm_3imrghhl': 'products',
+    'Gldas_noah': 'products',
+    'Persiann_ccs': 'products',
+    'Persiann_ccs_cdr': 'products',
+    'Era5_land': 'products',
+    'ImergGIS': 'products',
+    'Gfs': 'products',
+    'Pdirnow': 'products',
+}
+
+
+def __getattr__(name):
+    """
+    Import submodules and their classes on first access, so that
+    ``import hidrocl`` does not pull in xarray, rioxarray or cdsapi
+
+    Args:
+        name (str): attribute name
+
+    Returns:
+        module or class: requested submodule or class
+    """
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    """
+    List module attributes, including the lazily imported ones
+
+    Returns:
+        list: attribute names
+    """
+    return sorted(list(globals()) + list(_LAZY_MODULES) + list(_LAZY_ATTRIBUTES))
@@ -1,15 +1,170 @@
 # coding=utf-8
 
 import os
+import re
+import shutil
 import cdsapi
 import tarfile
-import pandas as pd
+import threading
+import uuid
+import xarray as xr
 import requests
+from functools import lru_cache
+from contextlib import contextmanager
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from tempfile import TemporaryDirectory
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+_CDS_CONFIG = {}
+_CDS_LOCAL = threading.local()
+
+_IMERG_URL = 'https://jsimpsonhttps.pps.eosdis.nasa.gov'
+_IMERG_EPOCH = datetime(2000, 6, 1)
+_IMERG_FILE_RE = re.compile(rb'/imerg/gis/\d{4}/\d{2}/3B-HHR-L\.[^"\s<>]+30min\.tif(?![\w.])')
+
+_HOURS = tuple(f'{hour:02d}:00' for hour in range(24))
+_DAYS = tuple(f'{day:02d}' for day in range(1, 32))
+_AREA = (-15, -75, -55, -65)
+
+_ERA5_LAND_VARS = (
+    '2m_temperature', 'potential_evaporation', 'snow_albedo',
+    'snow_cover', 'snow_density', 'snow_depth',
+    'snow_depth_water_equivalent', 'total_evaporation', 'total_precipitation',
+    'volumetric_soil_water_layer_1', 'volumetric_soil_water_layer_2', 'volumetric_soil_water_layer_3',
+    'volumetric_soil_water_layer_4',
+)
+
+_PACKING_KEYS = ('dtype', 'scale_factor', 'add_offset', '_FillValue', 'missing_value')
+
+_ERA5_LAND_BASE = {
+    'format': 'netcdf',
+    'variable': _ERA5_LAND_VARS,
+    'time': _HOURS,
+    'area': _AREA,
+}
+
+_SATSOILMOIST_BASE = {
+    'format': 'tgz',
+    'variable': 'volumetric_surface_soil_moisture',
+    'type_of_sensor': (
+        'combined_passive_and_active', 'passive',
+    ),
+    'time_aggregation': 'day_average',
+    'type_of_record': 'cdr',
+    'version': 'v202012.0.0',
+}
+
+
+def _get_cds(wait=True):
+    """return the CDS client of the current thread, creating it on first use
+
+    Each thread gets its own client, since a cdsapi.Client should not be
+    shared between threads.
+
+    Args:
+        wait (bool): if False, return the client whose retrieve calls come back as soon as the request is queued
+
+    Returns:
+        cdsapi.Client: CDS client reused across downloads
+    """
+    clients = _CDS_LOCAL.__dict__.setdefault('clients', {})
+    if wait not in clients:
+        if _CDS_CONFIG:
+            # reuse url and key already read from .cdsapirc by another client
+            clients[wait] = cdsapi.Client(**_CDS_CONFIG, wait_until_complete=wait)
+        else:
+            clients[wait] = cdsapi.Client(wait_until_complete=wait)
+            _CDS_CONFIG.update(url=clients[wait].url, key=clients[wait].key)
+    return clients[wait]
+
+
+@lru_cache(maxsize=None)
+def _imerg_session(user, password):
+    """return the keep-alive HTTP session used for jsimpsonhttps.pps.eosdis.nasa.gov
+
+    Args:
+        user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
+        password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
+
+    Returns:
+        requests.Session: session authenticated once and reused across requests
+    """
+    session = requests.Session()
+    session.auth = HTTPBasicAuth(user, password)
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                                          max_retries=Retry(total=5, backoff_factor=0.5,
+                                                            status_forcelist=(429, 500, 502, 503, 504),
+                                                            allowed_methods=frozenset(['GET', 'HEAD']),
+                                                            raise_on_status=False)))
+    return session
+
+
+def list_downloaded(path, suffix=''):
+    """function to list the files already downloaded in a folder
+
+    The folder is read with a single os.scandir pass. The returned set can be
+    updated by the caller as new files are downloaded.
+
+    Examples:
+        >>> files = list_downloaded('/path/to/data', '.nc')
+        >>> 'era5-land_20000601.nc' in files
+        True
+
+    Args:
+        path (str): folder to scan
+        suffix (str): only keep file names ending with this suffix
+
+    Returns:
+        set: file names in the folder
+    """
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries if entry.name.endswith(suffix)}
+
+
+@contextmanager
+def _atomic_path(fname):
+    """yield a temporary path next to fname that is moved onto fname if the block succeeds
+
+    A download that is interrupted never leaves a partial file under the
+    final name, so checks for already downloaded files stay correct. The
+    temporary name has no product extension, so the product readers do
+    not pick it up while it is being written.
+
+    Args:
+        fname (str): final path of the file
+
+    Yields:
+        str: temporary path to write to
+    """
+    tmp = os.path.join(os.path.dirname(fname), f'.{uuid.uuid4().hex}.part')
+    try:
+        yield tmp
+        os.replace(tmp, fname)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _is_downloaded(fname):
+    """check if a file was already downloaded, i.e. it exists and is not empty
+
+    Args:
+        fname (str): path of the file
+
+    Returns:
+        bool: True if the file exists and is not empty
+    """
+    try:
+        return os.path.getsize(fname) > 0
+    except OSError:
+        return False
 
 
-def download_era5land(year, month, day, path):
+def download_era5land(year, month, day, path, overwrite=False):
     """function to download era5-land reanalysis data from CDS
 
     This functions needs a .cdsapirc file in the home directory with the following content:
@@ -24,6 +179,7 @@ def download_era5land(year, month, day, path):
         month (int): month of the data to be downloaded
         day (int): day of the data to be downloaded
         path (str):path to save the data
+        overwrite (bool): if False, an existing non-empty file is not requested again
 
     Returns:
         None
@@ -32,44 +188,181 @@ def download_era5land(year, month, day, path):
 
     fname = os.path.join(path, f'era5-land_{year:04d}{month:02d}{day:02d}.nc')
 
-    c = cdsapi.Client()
-
-    c.retrieve(
-        'reanalysis-era5-land',
-        {
-            'format': 'netcdf',
-            'variable': [
-                '2m_temperature', 'potential_evaporation', 'snow_albedo',
-                'snow_cover', 'snow_density', 'snow_depth',
-                'snow_depth_water_equivalent', 'total_evaporation', 'total_precipitation',
-                'volumetric_soil_water_layer_1', 'volumetric_soil_water_layer_2', 'volumetric_soil_water_layer_3',
-                'volumetric_soil_water_layer_4',
-            ],
-            'month': [
-                str(month).zfill(2),
-            ],
-            'day': [
-                str(day).zfill(2),
-            ],
-            'time': [
-                '00:00', '01:00', '02:00',
-                '03:00', '04:00', '05:00',
-                '06:00', '07:00', '08:00',
-                '09:00', '10:00', '11:00',
-                '12:00', '13:00', '14:00',
-                '15:00', '16:00', '17:00',
-                '18:00', '19:00', '20:00',
-                '21:00', '22:00', '23:00',
-            ],
-            'year': [
-                str(year).zfill(4),
-            ],
-            'area': [
-                -15, -75, -55,
-                -65,
-            ],
-        },
-        fname)
+    if not overwrite and _is_downloaded(fname):
+        return
+
+    with _atomic_path(fname) as tmp:
+        _cds_retrieve('reanalysis-era5-land', _ERA5_LAND_BASE, year, [month], [f'{day:02d}'], target=tmp)
+
+
+def download_era5land_month(year, month, path):
+    """function to download a whole month of era5-land reanalysis data from CDS
+
+    The month is requested as a single CDS job and then split locally into
+    the same daily files written by download_era5land.
+
+    This functions needs a .cdsapirc file in the home directory with the following content:
+    url: https://cds.climate.copernicus.eu/api/v2
+    key: <your key>
+
+    Examples:
+        >>> download_era5land_month(2000, 6, '/path/to/data')
+
+    Args:
+        year (int): year of the data to be downloaded
+        month (int): month of the data to be downloaded
+        path (str): path to save the data
+
+    Returns:
+        None
+
+    """
+
+    result = _cds_retrieve('reanalysis-era5-land', _ERA5_LAND_BASE, year, [month], _DAYS)
+
+    save_era5land_month(result, path)
+
+
+def submit_era5land_month(year, month):
+    """function to submit a month of era5-land reanalysis data to the CDS queue without waiting for it
+
+    Several months can be queued at once and then saved with save_era5land_month
+    when CDS reports them as completed.
+
+    Examples:
+        >>> result = submit_era5land_month(2000, 6)
+        >>> result.update()
+        >>> result.reply['state']
+        'queued'
+
+    Args:
+        year (int): year of the data to be downloaded
+        month (int): month of the data to be downloaded
+
+    Returns:
+        cdsapi.api.Result: CDS request handle
+
+    """
+
+    return _cds_retrieve('reanalysis-era5-land', _ERA5_LAND_BASE, year, [month], _DAYS, wait=False)
+
+
+def save_era5land_month(result, path):
+    """function to save a completed era5-land monthly request as daily files
+
+    Examples:
+        >>> save_era5land_month(result, '/path/to/data')
+
+    Args:
+        result (cdsapi.api.Result): completed CDS request
+        path (str): path to save the data
+
+    Returns:
+        None
+
+    """
+
+    _save_era5land_daily(result, path)
+
+
+def download_era5land_range(year, months, path, days=None):
+    """function to download several months of one year of era5-land reanalysis data from CDS
+
+    All the months are requested as a single CDS job, so the request waits in
+    the CDS queue only once, and then split locally into the same daily files
+    written by download_era5land. CDS limits the size of a single request, so
+    a whole year of all variables may be rejected; in that case ask for fewer
+    months at a time.
+
+    This functions needs a .cdsapirc file in the home directory with the following content:
+    url: https://cds.climate.copernicus.eu/api/v2
+    key: <your key>
+
+    Examples:
+        >>> download_era5land_range(2000, [6, 7, 8], '/path/to/data')
+        >>> download_era5land_range(2000, [6], '/path/to/data', days=[1, 2, 3])
+
+    Args:
+        year (int): year of the data to be downloaded
+        months (list): months of the data to be downloaded
+        path (str): path to save the data
+        days (list): days of the data to be downloaded. If None, all days are downloaded
+
+    Returns:
+        None
+
+    """
+
+    days = _DAYS if days is None else [f'{day:02d}' for day in days]
+
+    result = _cds_retrieve('reanalysis-era5-land', _ERA5_LAND_BASE, year, months, days)
+
+    _save_era5land_daily(result, path)
+
+
+def _save_era5land_daily(result, path):
+    """download a completed era5-land request and split it into daily files
+
+    Args:
+        result (cdsapi.api.Result): completed CDS request
+        path (str): path to save the data
+    """
+    with TemporaryDirectory() as tempdirname:
+        fname = os.path.join(tempdirname, 'era5-land.nc')
+
+        result.download(fname)
+
+        with xr.open_dataset(fname) as ds:
+            for date, ds_day in ds.groupby('time.date'):
+                with _atomic_path(os.path.join(path, f'era5-land_{date:%Y%m%d}.nc')) as tmp:
+                    ds_day.to_netcdf(tmp, encoding=_compressed_encoding(ds_day))
+
+
+def _compressed_encoding(ds):
+    """build a netCDF encoding with zlib compression and one chunk per time step
+
+    Extraction reads whole fields and reduces them over time, so each chunk
+    holds a full (lat, lon) grid of a single hour. The CDS packing
+    (dtype, scale_factor, add_offset, fill values) is kept.
+
+    Args:
+        ds (xarray.Dataset): dataset to be written
+
+    Returns:
+        dict: encoding for xarray.Dataset.to_netcdf
+    """
+    encoding = {}
+    for var in ds.data_vars:
+        da = ds[var]
+        encoding[var] = {key: value for key, value in da.encoding.items() if key in _PACKING_KEYS}
+        encoding[var].update(zlib=True, complevel=1, shuffle=True)
+        if da.ndim == 3:
+            encoding[var]['chunksizes'] = (1,) + da.shape[1:]
+    return encoding
+
+
+def _cds_retrieve(dataset, base, year, months, days, target=None, wait=True):
+    """retrieve a CDS dataset for the given dates with the shared client
+
+    Args:
+        dataset (str): CDS dataset name
+        base (dict): dataset specific part of the request
+        year (int): year of the data
+        months (list): months of the data
+        days (list): days of the data, as two digit strings
+        target (str): file to download the data to. If None, the data is not downloaded
+        wait (bool): wait until CDS completes the request
+
+    Returns:
+        cdsapi.api.Result: CDS request handle
+    """
+    request = {
+        **base,
+        'year': [f'{year:04d}'],
+        'month': [f'{month:02d}' for month in months],
+        'day': days,
+    }
+    return _get_cds(wait).retrieve(dataset, request, target)
 
 
 def download_satsoilmoist(year, month, day, path):
@@ -88,32 +381,143 @@ def download_satsoilmoist(year, month, day, path):
         None
     """
 
-    c = cdsapi.Client()
+    c = _get_cds()
+
+    result = _cds_retrieve('satellite-soil-moisture', _SATSOILMOIST_BASE, year, [month], [f'{day:02d}'])
+
+    with c.session.get(result.location, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with tarfile.open(fileobj=response.raw, mode='r|gz', bufsize=2 * 1024 * 1024) as tar:
+            # streaming mode reads members in order, so each one is extracted as it arrives
+            for member in tar:
+                if member.isfile() and member.name.endswith('.nc'):
+                    # only the file name is kept, so no member is written outside path
+                    member.name = os.path.basename(member.name)
+                    tar.extract(member, path=path)
+
+
+def download_era5land_many(dates, path, workers=4):
+    """function to download several days of era5-land reanalysis data from CDS at the same time
+
+    Each day is downloaded with download_era5land in a pool of threads, each
+    one with its own CDS client. CDS only runs a few requests per user at a
+    time and queues the rest, so more than 4 workers rarely helps.
+
+    Examples:
+        >>> dates = pd.date_range('2000-06-01', '2000-06-10')
+        >>> download_era5land_many(dates, '/path/to/data')
+        []
+
+    Args:
+        dates (list): dates of the data to be downloaded
+        path (str): path to save the data
+        workers (int): number of CDS requests running concurrently
+
+    Returns:
+        list: dates that could not be downloaded
+    """
+
+    return _cds_many(download_era5land, dates, path, workers)
+
+
+def download_satsoilmoist_many(dates, path, workers=4):
+    """function to download several days of Soil moisture gridded data from CDS at the same time
+
+    Each day is downloaded with download_satsoilmoist in a pool of threads,
+    each one with its own CDS client. CDS only runs a few requests per user
+    at a time and queues the rest, so more than 4 workers rarely helps.
+
+    Examples:
+        >>> dates = pd.date_range('2000-06-01', '2000-06-10')
+        >>> download_satsoilmoist_many(dates, '/path/to/data')
+        []
+
+    Args:
+        dates (list): dates of the data to be downloaded
+        path (str): path to save the data
+        workers (int): number of CDS requests running concurrently
+
+    Returns:
+        list: dates that could not be downloaded
+    """
+
+    return _cds_many(download_satsoilmoist, dates, path, workers)
+
+
+def _cds_many(download, dates, path, workers):
+    """run a daily CDS download function for several dates in a thread pool
+
+    Args:
+        download (function): download_era5land or download_satsoilmoist
+        dates (list): dates of the data to be downloaded
+        path (str): path to save the data
+        workers (int): number of CDS requests running concurrently
+
+    Returns:
+        list: dates that could not be downloaded
+    """
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(download, date.year, date.month, date.day, path): date
+                   for date in dates}
+        for future in as_completed(futures):
+            date = futures[future]
+            try:
+                future.result()
+            except Exception:
+                # cdsapi reports failed requests with a plain Exception
+                print(f'Error downloading date: {date:%Y-%m-%d}')
+                failed.append(date)
+
+    return failed
+
 
-    c.retrieve(
-        'satellite-soil-moisture',
-        {
-            'format': 'tgz',
-            'variable': 'volumetric_surface_soil_moisture',
-            'type_of_sensor': [
-                'combined_passive_and_active', 'passive',
-            ],
-            'time_aggregation': 'day_average',
-            'month': str(month).zfill(2),
-            'year': str(year).zfill(4),
-            'day': str(day).zfill(2),
-            'type_of_record': 'cdr',
-            'version': 'v202012.0.0',
-        },
-        'download.tar.gz')
+def list_imerg(year, month, user, password, timeout=60):
+    """function to list IMERG data filenames of one month from jsimpsonhttps.pps.eosdis.nasa.gov
 
-    with tarfile.open('download.tar.gz') as tar:
-        tar.extractall(path=path)
+    Examples:
+        >>> list_imerg(2000, 6, 'user@doma.in', 'password')
+        ['/imerg/gis/2000/06/3B-HHR-L.MS.MRG.3IMERG.20000608-S000000-E002959.0000.V06B.30min.tif',
+         ...]
+
+    Args:
+        year (int): year of the data to be listed
+        month (int): month of the data to be listed
+        user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
+        password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
+        timeout (int): timeout in seconds
+
+    Returns:
+        list: a list representing the filename of IMERG data available for the requested month
+    """
+
+    url = f'{_IMERG_URL}/text/imerg/gis/{year:04d}/{month:02d}/'
+
+    response = _imerg_session(user, password).get(url, timeout=timeout)
+    response.raise_for_status()
 
-    os.remove('download.tar.gz')
+    return [val.decode('ascii') for val in _IMERG_FILE_RE.findall(response.content)]
 
 
-def get_imerg(start, end, user, password, timeout=60):
+def _months(start, end):
+    """iterate over the (year, month) pairs from start to end, both included
+
+    Args:
+        start (datetime): first month
+        end (datetime): last month
+
+    Yields:
+        tuple: year and month
+    """
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def get_imerg(start, end, user, password, timeout=60, workers=8):
     """function to get IMERG data filenames from jsimpsonhttps.pps.eosdis.nasa.gov
 
     Examples:
@@ -128,6 +532,7 @@ def get_imerg(start, end, user, password, timeout=60):
         user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
         password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
         timeout (int): timeout in seconds
+        workers (int): number of months listed concurrently
 
     Returns:
         list: a list representing the filename of IMERG data available for the requested period
@@ -137,45 +542,61 @@ def get_imerg(start, end, user, password, timeout=60):
             - start or end are not in the format YYYY-MM
             - start is after end
             - start is less than 2000-06
+            - end is after the current month
     """
 
-    start = pd.to_datetime(start+'-01', format="%Y-%m-%d")
-    end = pd.to_datetime(end+'-01', format="%Y-%m-%d")
-
-    if start > end:
-        raise ValueError("start date should be less than end date")
+    return list(iter_imerg(start, end, user, password, timeout, workers))
 
-    if start.year < 2000:
-        raise ValueError("start date should be greater than 2000")
 
-    if end.year > datetime.now().year:
-        raise ValueError("end date should be less than current year")
+def iter_imerg(start, end, user, password, timeout=60, workers=8):
+    """function to iterate over IMERG data filenames from jsimpsonhttps.pps.eosdis.nasa.gov
 
-    if start.year == 200 and start.month < 6:
-        raise ValueError("start date should be greater than 2000-06-01")
+    Same as get_imerg, but the filenames of each month are yielded as soon as
+    its listing arrives, so downloads can start while later months are
+    still being listed. The dates are checked when the iteration starts.
 
-    p = pd.period_range(start, end, freq='M')
+    Examples:
+        >>> for file in iter_imerg('2000-06', '2000-07', 'user@doma.in', 'password'):
+        >>>     download_imerg(file, '/path/to/data',  'user@doma.in', 'password')
+        xyz1.tif downloaded
+        xyz2.tif downloaded
+        ...
 
-    final_response = []
+    Args:
+        start (str): start date in the format YYYY-MM
+        end (str): start date in the format YYYY-MM
+        user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
+        password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
+        timeout (int): timeout in seconds
+        workers (int): number of months listed concurrently
 
-    for yyyymm in p:
-        year = int(yyyymm.strftime('%Y'))
-        month = int(yyyymm.strftime('%m'))
+    Yields:
+        str: filename of IMERG data available for the requested period, in month order
 
-        url = f'https://jsimpsonhttps.pps.eosdis.nasa.gov/text/imerg/gis/{year:04d}/{month:02d}/'
+    Raises:
+        ValueError: same as get_imerg
+    """
 
-        response = requests.get(url, auth=HTTPBasicAuth(user, password), timeout=timeout)
+    start = datetime.strptime(start, '%Y-%m')
+    end = datetime.strptime(end, '%Y-%m')
 
-        vals = str(response.content).split('\\n')
+    if start > end:
+        raise ValueError("start date should be less than end date")
 
-        vals_filtered = [val for val in vals if '3B-HHR-L' in val and '30min.tif' in val]
+    if start < _IMERG_EPOCH:
+        raise ValueError("start date should be greater than 2000-06-01")
 
-        final_response.extend(vals_filtered)
+    if end > datetime.now():
+        raise ValueError("end date should not be after the current month")
 
-    return final_response
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        listings = executor.map(lambda yyyymm: list_imerg(*yyyymm, user, password, timeout),
+                                _months(start, end))
+        for vals_filtered in listings:
+            yield from vals_filtered
 
 
-def download_imerg(url_extract, folder, user, password, timeout=60):
+def download_imerg(url_extract, folder, user, password, timeout=60, overwrite=False):
     """download IMERG data from jsimpsonhttps.pps.eosdis.nasa.gov.
 
     It is recommended to use the function get_imerg to get the filenames of the data to be downloaded
@@ -198,17 +619,149 @@ def download_imerg(url_extract, folder, user, password, timeout=60):
         user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
         password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
         timeout (int): timeout in seconds
+        overwrite (bool): if False, an existing non-empty file is kept without contacting the server.
+            If True, it is downloaded again only if the server copy changed
 
     Returns:
         None
     """
 
-    url = 'https://jsimpsonhttps.pps.eosdis.nasa.gov'+url_extract
-    fname = url.split('/')[-1]
+    url = _IMERG_URL + url_extract
+    fname = url_extract.rsplit('/', 1)[-1]
+    fpath = os.path.join(folder, fname)
 
-    response = requests.get(url, auth=HTTPBasicAuth(user, password), timeout=timeout)
-    response.raise_for_status()
+    if not overwrite and _is_downloaded(fpath):
+        print(f'{fname} already downloaded')
+        return
+
+    # the local mtime mirrors the server Last-Modified, so an unchanged file is not sent again
+    headers = {}
+    if os.path.exists(fpath):
+        headers['If-Modified-Since'] = formatdate(os.path.getmtime(fpath), usegmt=True)
+
+    response = _imerg_session(user, password).get(url, timeout=timeout, stream=True, headers=headers)
+
+    with response:
+        if response.status_code == 304:
+            print(f'{fname} not modified')
+            return
+        response.raise_for_status()
+        response.raw.decode_content = True
+        last_modified = response.headers.get('Last-Modified')
+        with _atomic_path(fpath) as tmp, open(tmp, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+            _drop_page_cache(f)
+
+    if last_modified:
+        mtime = parsedate_to_datetime(last_modified).timestamp()
+        os.utime(fpath, (mtime, mtime))
+
+    print(f'{fname} downloaded')
+
+
+def _drop_page_cache(f):
+    """flush a written file and tell the kernel its pages are not needed anymore
+
+    Downloaded files are not read again by the downloader, so keeping them in
+    the page cache only evicts data that is in use. Does nothing where
+    os.posix_fadvise is not available.
+
+    Args:
+        f (file): open file object
+    """
+    if hasattr(os, 'posix_fadvise'):
+        f.flush()
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def bulk_download_imerg(start, end, folder, user, password, timeout=60, workers=8, downloaded=None):
+    """list and download IMERG data from jsimpsonhttps.pps.eosdis.nasa.gov for a period.
+
+    Listing and downloads share the same pooled HTTP session, and up to
+    workers files are downloaded at the same time. Files already in folder
+    are skipped.
+
+    Examples:
+        >>> bulk_download_imerg('2000-06', '2000-07', '/path/to/data', 'user@doma.in', 'password')
+        xyz1.tif downloaded
+        xyz2.tif downloaded
+        ...
+        []
+
+    Args:
+        start (str): start date in the format YYYY-MM
+        end (str): end date in the format YYYY-MM
+        folder (str): folder to save the data
+        user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
+        password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
+        timeout (int): timeout in seconds
+        workers (int): number of files downloaded concurrently
+        downloaded (set): names of files already in folder. If None, folder is scanned. It is updated in place
+
+    Returns:
+        list: url extracts of the files that could not be downloaded
+    """
+
+    if downloaded is None:
+        downloaded = list_downloaded(folder, '.tif')
+
+    submitted = {}
+
+    def pending():
+        # downloads start while the later months are still being listed
+        for file in iter_imerg(start, end, user, password, timeout):
+            fname = file.rsplit('/', 1)[-1]
+            if fname not in downloaded:
+                submitted[file] = fname
+                yield file
+
+    failed = download_imerg_many(pending(), folder, user, password, timeout, workers)
+
+    failed_set = set(failed)
+    downloaded.update(fname for file, fname in submitted.items() if file not in failed_set)
+
+    return failed
+
+
+def download_imerg_many(files, folder, user, password, timeout=60, workers=8):
+    """download several IMERG files from jsimpsonhttps.pps.eosdis.nasa.gov at the same time.
+
+    Each file is downloaded with download_imerg in a pool of threads sharing
+    the same keep-alive HTTP session. A failed file does not stop the others.
+
+    Examples:
+        >>> files = get_imerg('2000-06', '2000-07', 'user@doma.in', 'password')
+        >>> download_imerg_many(files, '/path/to/data', 'user@doma.in', 'password', workers=16)
+        xyz1.tif downloaded
+        xyz2.tif downloaded
+        ...
+        []
+
+    Args:
+        files (iterable): url extracts in format '/imerg/gis/2000/06/xyz.tif'. A generator such as
+            iter_imerg is consumed while the first files are already downloading
+        folder (str): folder to save the data
+        user (str): username to access jsimpsonhttps.pps.eosdis.nasa.gov
+        password (str): password to access jsimpsonhttps.pps.eosdis.nasa.gov
+        timeout (int): timeout in seconds
+        workers (int): number of files downloaded concurrently
+
+    Returns:
+        list: url extracts of the files that could not be downloaded
+    """
+
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(download_imerg, file, folder, user, password, timeout): file
+                   for file in files}
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                future.result()
+            except (requests.RequestException, OSError):
+                print(f'Error downloading file: {file}')
+                failed.append(file)
 
-    with open(os.path.join(folder, fname), 'wb') as f:
-        f.write(response.content)
-        print(f'{fname} downloaded')
+    return failed
@@ -1,19 +1,107 @@
 # coding=utf-8
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
+from functools import cached_property
+
 from ..variables import HidroCLVariable
 from . import tools as t
 from . import maintainer as m
 from . import extractions as e
 
 
+class _BaseProduct:
+    """
+    Common base of the product classes, with the catalog of product files
+
+    Attributes:
+        productpath (str): Path to the product folder where the product files are located \n
+        product_files (list): List of product files in the product folder \n
+        product_ids (list): List of product ids. Each product id is str with common tag by date \n
+        all_scenes (list): List of all scenes (no matter the product id here) \n
+        scenes_occurrences (list): List of scenes occurrences for each product id \n
+        overpopulated_scenes (list): List of overpopulated scenes \n
+        complete_scenes (list): List of complete scenes \n
+        incomplete_scenes (list): List of incomplete scenes \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
+        scenes_to_process (list): List of scenes to process (complete scenes no processed) \n
+    """
+
+    def __init__(self, product_path, what, variable=None):
+        """
+        The product folder is only read when one of the catalog attributes
+        is first used
+
+        Args:
+            product_path (str): Path to the product folder
+            what (str): Product type, as taken by tools.ProductCatalog
+            variable (str): Variable name, only used by gfs
+        """
+        self.productpath = product_path
+        self._what = what
+        self._variable = variable
+        self._scratch_dir = t.make_scratch_dir(self)
+
+    @cached_property
+    def _catalog(self):
+        # the catalog is shared by products reading the same folder
+        return t.ProductCatalog.get(self.productpath, self._what, variable=self._variable)
+
+    @property
+    def product_files(self):
+        return self._catalog.product_files
+
+    @property
+    def product_ids(self):
+        return self._catalog.product_ids
+
+    @property
+    def all_scenes(self):
+        return self._catalog.all_scenes
+
+    @property
+    def scenes_occurrences(self):
+        return self._catalog.scenes_occurrences
+
+    @property
+    def overpopulated_scenes(self):
+        return self._catalog.overpopulated_scenes
+
+    @property
+    def complete_scenes(self):
+        return self._catalog.complete_scenes
+
+    @property
+    def incomplete_scenes(self):
+        return self._catalog.incomplete_scenes
+
+    @property
+    def scenes_path(self):
+        return self._catalog.scenes_path
+
+    @property
+    def scenes_files(self):
+        return self._catalog.scenes_files
+
+    @cached_property
+    def scenes_to_process(self):
+        return t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, what=self._what)
+
+    def __repr__(self):
+        """
+        Return a string representation of the object
+
+        Returns:
+             str: String representation of the object
+        """
+        return f'Class to extract {self.productname}'
+
+
 """
 Extraction of MODIS MOD13Q1 product:
 """
 
 
-class Mod13q1:
+class Mod13q1(_BaseProduct):
     """
     A class to process MOD13Q1 to hidrocl variables
 
@@ -29,6 +117,8 @@ class Mod13q1:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): List of common elements between the NDVI, EVI and NBR databases \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -78,32 +168,14 @@ class Mod13q1:
             self.evi_log = evi_log
             self.nbr_log = nbr_log
             self.productname = "MODIS MOD13Q1 Version 6.1"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = t.compare_indatabase(self.ndvi.indatabase,
                                                         self.evi.indatabase,
                                                         self.nbr.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "modis")
-            self.product_ids = t.get_product_ids(self.product_files, "modis")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "modis")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='modis')
+            super().__init__(product_path, "modis")
         else:
             raise TypeError('ndvi, evi and nbr must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -124,7 +196,7 @@ NBR records: {len(self.nbr.indatabase)}.
 NBR database path: {self.nbr.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -132,15 +204,16 @@ NBR database path: {self.nbr.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.ndvi.checkdatabase()
-            self.evi.checkdatabase()
-            self.nbr.checkdatabase()
+        self.ndvi.checkdatabase(verbose=False)
+        self.evi.checkdatabase(verbose=False)
+        self.nbr.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.ndvi.indatabase,
                                                     self.evi.indatabase,
@@ -148,44 +221,41 @@ NBR database path: {self.nbr.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        temp_dir = self._scratch_dir
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
+        with t.SceneExecutor(workers, threads) as executor:
             for scene in scenes_to_process:
+                layers = {}
                 if scene not in self.ndvi.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'ndvi',
-                                  self.ndvi.catchment_names, self.ndvi_log,
-                                  database=self.ndvi.database,
-                                  pcdatabase=self.ndvi.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="250m 16 days NDVI", )
+                    layers['ndvi'] = dict(layer="250m 16 days NDVI",
+                                          catchment_names=self.ndvi.catchment_names,
+                                          log_file=self.ndvi_log,
+                                          database=self.ndvi.database,
+                                          pcdatabase=self.ndvi.pcdatabase)
 
                 if scene not in self.evi.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'evi',
-                                  self.evi.catchment_names, self.evi_log,
-                                  database=self.evi.database,
-                                  pcdatabase=self.evi.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="250m 16 days EVI", )
-
-                if scene not in self.evi.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'nbr',
-                                  self.nbr.catchment_names, self.nbr_log,
-                                  database=self.nbr.database,
-                                  pcdatabase=self.nbr.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer=["250m 16 days NIR reflectance",
-                                         "250m 16 days MIR reflectance"])
+                    layers['evi'] = dict(layer="250m 16 days EVI",
+                                         catchment_names=self.evi.catchment_names,
+                                         log_file=self.evi_log,
+                                         database=self.evi.database,
+                                         pcdatabase=self.evi.pcdatabase)
+
+                if scene not in self.nbr.indatabase:
+                    layers['nbr'] = dict(layer=["250m 16 days NIR reflectance",
+                                                "250m 16 days MIR reflectance"],
+                                         catchment_names=self.nbr.catchment_names,
+                                         log_file=self.nbr_log,
+                                         database=self.nbr.database,
+                                         pcdatabase=self.nbr.pcdatabase)
+
+                if layers:
+                    executor.submit(e.zonal_stats_multilayer, scene, self.scenes_files[scene],
+                                    temp_dir, layers, self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -199,10 +269,9 @@ NBR database path: {self.nbr.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.ndvi.checkdatabase()
-            self.evi.checkdatabase()
-            self.nbr.checkdatabase()
+        self.ndvi.checkdatabase(verbose=False)
+        self.evi.checkdatabase(verbose=False)
+        self.nbr.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.ndvi.indatabase,
                                                     self.evi.indatabase,
@@ -210,8 +279,6 @@ NBR database path: {self.nbr.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -219,7 +286,7 @@ NBR database path: {self.nbr.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='modis',
                               log_file=log_file)
 
@@ -229,7 +296,7 @@ Extraction of MODIS MOD10A2 product:
 """
 
 
-class Mod10a2:
+class Mod10a2(_BaseProduct):
     """
     A class to process MOD10A2 to hidrocl variables
 
@@ -243,6 +310,8 @@ class Mod10a2:
         southvectorpath (str): Path to the vector folder with the south Shapefile with areas to be processed \n
         common_elements (list): List of common elements between the nsnow and ssnow databases \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -286,32 +355,14 @@ class Mod10a2:
             self.ssnow = ssnow
             self.snow_log = snow_log
             self.productname = "MODIS MOD10A2 Version 6.1"
-            self.productpath = product_path
             self.northvectorpath = north_vector_path
             self.southvectorpath = south_vector_path
             self.common_elements = t.compare_indatabase(self.nsnow.indatabase,
                                                         self.ssnow.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "modis")
-            self.product_ids = t.get_product_ids(self.product_files, "modis")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "modis")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='modis')
+            super().__init__(product_path, "modis")
         else:
             raise TypeError('nsnow and ssnow must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -329,49 +380,48 @@ South face snow records: {len(self.ssnow.indatabase)}.
 South face snow database path: {self.ssnow.database}
                 '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, threads=False):
         """Run the extraction of the product.
         If limit is None, all scenes will be processed.
         If limit is a number, only the first limit scenes will be processed.
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.nsnow.checkdatabase()
-            self.ssnow.checkdatabase()
+        self.nsnow.checkdatabase(verbose=False)
+        self.ssnow.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.nsnow.indatabase,
                                                     self.ssnow.indatabase)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
-
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
+        with t.SceneExecutor(workers, threads) as executor:
             for scene in scenes_to_process:
                 if scene not in self.nsnow.indatabase:  # so what about the south one?
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snow',
-                                  self.nsnow.catchment_names, self.snow_log,
-                                  north_database=self.nsnow.database,
-                                  north_pcdatabase=self.nsnow.pcdatabase,
-                                  south_database=self.ssnow.database,
-                                  south_pcdatabase=self.ssnow.pcdatabase,
-                                  north_vector_path=self.northvectorpath,
-                                  south_vector_path=self.southvectorpath,
-                                  layer="Maximum_Snow_Extent")
+                    executor.submit(e.zonal_stats, scene, self.scenes_files[scene],
+                                    temp_dir, 'snow',
+                                    self.nsnow.catchment_names, self.snow_log,
+                                    north_database=self.nsnow.database,
+                                    north_pcdatabase=self.nsnow.pcdatabase,
+                                    south_database=self.ssnow.database,
+                                    south_pcdatabase=self.ssnow.pcdatabase,
+                                    north_vector_path=self.northvectorpath,
+                                    south_vector_path=self.southvectorpath,
+                                    layer="Maximum_Snow_Extent")
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -385,17 +435,14 @@ South face snow database path: {self.ssnow.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.nsnow.checkdatabase()
-            self.ssnow.checkdatabase()
+        self.nsnow.checkdatabase(verbose=False)
+        self.ssnow.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.nsnow.indatabase,
                                                     self.ssnow.indatabase)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -403,7 +450,7 @@ South face snow database path: {self.ssnow.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='modis',
                               log_file=log_file)
 
@@ -413,7 +460,7 @@ Extraction of MODIS MOD16A2 product:
 """
 
 
-class Mod16a2:
+class Mod16a2(_BaseProduct):
 
     """
     A class to process MOD16A2 to hidrocl variables
@@ -428,6 +475,8 @@ class Mod16a2:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): Elements in pet database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -469,31 +518,13 @@ class Mod16a2:
             self.pet_log = pet_log
             self.et_log = et_log
             self.productname = "MODIS MOD16A2 Version 6.1"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = t.compare_indatabase(self.pet.indatabase,
                                                         self.et.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "modis")
-            self.product_ids = t.get_product_ids(self.product_files, "modis")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "modis")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='modis')
+            super().__init__(product_path, "modis")
         else:
             raise TypeError('pet must be HidroCLVariable object')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -511,7 +542,7 @@ ET records: {len(self.et.indatabase)}.
 ET database path: {self.et.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -519,48 +550,51 @@ ET database path: {self.et.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pet.checkdatabase()
-            self.et.checkdatabase()
+        self.pet.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.pet.indatabase,
                                                     self.et.indatabase)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        temp_dir = self._scratch_dir
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            for scene in scenes_to_process:
-                if scene not in self.pet.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'et',
-                                  self.pet.catchment_names, self.pet_log,
-                                  database=self.pet.database,
-                                  pcdatabase=self.pet.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="PET_500m", )
-
-                if scene not in self.pet.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'et',
-                                  self.et.catchment_names, self.et_log,
-                                  database=self.et.database,
-                                  pcdatabase=self.et.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="ET_500m", )
+        with t.SceneExecutor(workers, threads) as executor:
+            scenes = [scene for scene in scenes_to_process if scene not in self.pet.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'et',
+                                self.pet.catchment_names, self.pet_log,
+                                database=self.pet.database,
+                                pcdatabase=self.pet.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="PET_500m", )
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.et.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'et',
+                                self.et.catchment_names, self.et_log,
+                                database=self.et.database,
+                                pcdatabase=self.et.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="ET_500m", )
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -574,13 +608,10 @@ ET database path: {self.et.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pet.checkdatabase()
+        self.pet.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pet.indatabase)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -588,7 +619,7 @@ ET database path: {self.et.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='modis',
                               log_file=log_file)
 
@@ -598,7 +629,7 @@ Extraction of MODIS MCD15A2H product:
 """
 
 
-class Mcd15a2h:
+class Mcd15a2h(_BaseProduct):
     """
     A class to process MCD15A2H to hidrocl variables
 
@@ -612,6 +643,8 @@ class Mcd15a2h:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): List of common elements between the FPAR and LAI databases \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -655,31 +688,13 @@ class Mcd15a2h:
             self.lai_log = lai_log
             self.fpar_log = fpar_log
             self.productname = "MODIS MCD15A2H Version 6.0"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = t.compare_indatabase(self.lai.indatabase,
                                                         self.fpar.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "modis")
-            self.product_ids = t.get_product_ids(self.product_files, "modis")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "modis")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='modis')
+            super().__init__(product_path, "modis")
         else:
             raise TypeError('lai and fpar must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -697,7 +712,7 @@ FPAR records: {len(self.fpar.indatabase)}.
 FPAR database path: {self.fpar.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -705,48 +720,51 @@ FPAR database path: {self.fpar.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.lai.checkdatabase()
-            self.fpar.checkdatabase()
+        self.lai.checkdatabase(verbose=False)
+        self.fpar.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.lai.indatabase,
                                                     self.fpar.indatabase)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        temp_dir = self._scratch_dir
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            for scene in scenes_to_process:
-                if scene not in self.lai.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'lai',
-                                  self.lai.catchment_names, self.lai_log,
-                                  database=self.lai.database,
-                                  pcdatabase=self.lai.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="Lai_500m", )
-
-                if scene not in self.fpar.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'fpar',
-                                  self.fpar.catchment_names, self.fpar_log,
-                                  database=self.fpar.database,
-                                  pcdatabase=self.fpar.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="Fpar_500m")
+        with t.SceneExecutor(workers, threads) as executor:
+            scenes = [scene for scene in scenes_to_process if scene not in self.lai.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'lai',
+                                self.lai.catchment_names, self.lai_log,
+                                database=self.lai.database,
+                                pcdatabase=self.lai.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="Lai_500m", )
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.fpar.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'fpar',
+                                self.fpar.catchment_names, self.fpar_log,
+                                database=self.fpar.database,
+                                pcdatabase=self.fpar.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="Fpar_500m")
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -760,17 +778,14 @@ FPAR database path: {self.fpar.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.lai.checkdatabase()
-            self.fpar.checkdatabase()
+        self.lai.checkdatabase(verbose=False)
+        self.fpar.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.lai.indatabase,
                                                     self.fpar.indatabase)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements)
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -778,7 +793,7 @@ FPAR database path: {self.fpar.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='modis',
                               log_file=log_file)
 
@@ -788,7 +803,7 @@ Extraction of GPM IMERG Late Precipitation L3 Half Hourly 0.1 degree product:
 """
 
 
-class Gpm_3imrghhl:
+class Gpm_3imrghhl(_BaseProduct):
     """
     A class to process GPM_3IMRGHHL to hidrocl variables
 
@@ -800,6 +815,8 @@ class Gpm_3imrghhl:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): common_elements (list): Elements in precipitation database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -832,30 +849,12 @@ class Gpm_3imrghhl:
             self.pp = pp
             self.pp_log = pp_log
             self.productname = "GPM IMERG Late Precipitation L3 Half Hourly 0.1 degree Version 0.6"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = self.pp.indatabase
-            self.product_files = t.read_product_files(self.productpath, "imerg")
-            self.product_ids = t.get_product_ids(self.product_files, "imerg")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "imerg")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='imerg')
+            super().__init__(product_path, "imerg")
         else:
             raise TypeError('pp must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -870,7 +869,7 @@ IMERG precipitation records: {len(self.pp.indatabase)}.
 IMERG precipitation database path: {self.pp.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -878,35 +877,37 @@ IMERG precipitation database path: {self.pp.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "imerg")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
 
-            for scene in scenes_to_process:
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'imerg',
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="Grid_precipitationCal")
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'imerg',
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="Grid_precipitationCal")
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -920,13 +921,10 @@ IMERG precipitation database path: {self.pp.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "imerg")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -934,7 +932,7 @@ IMERG precipitation database path: {self.pp.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='imerg',
                               log_file=log_file)
 
@@ -944,7 +942,7 @@ Extraction of GPM IMERG GIS Late Run Precipitation Half Hourly 0.1 degree produc
 """
 
 
-class ImergGIS:
+class ImergGIS(_BaseProduct):
     """
     A class to process GPM_3IMRGHHL GIS  to hidrocl variables.
 
@@ -958,6 +956,8 @@ class ImergGIS:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): common_elements (list): Elements in precipitation database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -990,30 +990,12 @@ class ImergGIS:
             self.pp = pp
             self.pp_log = pp_log
             self.productname = "GPM IMERG GIS Late Run Precipitation Half Hourly 0.1 degree Version 6"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = self.pp.indatabase
-            self.product_files = t.read_product_files(self.productpath, "imgis")
-            self.product_ids = t.get_product_ids(self.product_files, "imgis")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "imgis")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='imgis')
+            super().__init__(product_path, "imgis")
         else:
             raise TypeError('pp must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -1028,7 +1010,7 @@ IMERG GIS precipitation records: {len(self.pp.indatabase)}.
 IMERG GIS precipitation database path: {self.pp.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -1036,34 +1018,36 @@ IMERG GIS precipitation database path: {self.pp.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "imgis")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
 
-            for scene in scenes_to_process:
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'imgis',
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath)
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'imgis',
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -1077,13 +1061,10 @@ IMERG GIS precipitation database path: {self.pp.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "imgis")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -1091,7 +1072,7 @@ IMERG GIS precipitation database path: {self.pp.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='imgis',
                               log_file=log_file)
 
@@ -1101,7 +1082,7 @@ Extraction of GLDAS_NOAH025_3H product:
 """
 
 
-class Gldas_noah:
+class Gldas_noah(_BaseProduct):
     """
     A class to process GLDAS_NOAH025_3H to hidrocl variables
 
@@ -1119,6 +1100,8 @@ class Gldas_noah:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): List of common elements between the snow, temp, et and soilm databases \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -1174,33 +1157,15 @@ class Gldas_noah:
             self.et_log = et_log
             self.soilm_log = soilm_log
             self.productname = "GLDAS Noah Land Surface Model L4 3 hourly 0.25 degree Version 2.1"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = t.compare_indatabase(self.snow.indatabase,
                                                         self.temp.indatabase,
                                                         self.et.indatabase,
                                                         self.soilm.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "gldas")
-            self.product_ids = t.get_product_ids(self.product_files, "gldas")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "gldas")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='gldas')
+            super().__init__(product_path, "gldas")
         else:
             raise TypeError('snow, temp, et and soilm must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -1224,7 +1189,7 @@ Soil moisture records: {len(self.soilm.indatabase)}.
 Soil moisture path: {self.soilm.database}
                 '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -1232,16 +1197,18 @@ Soil moisture path: {self.soilm.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.snow.checkdatabase()
-            self.temp.checkdatabase()
-            self.et.checkdatabase()
-            self.soilm.checkdatabase()
+        self.snow.checkdatabase(verbose=False)
+        self.temp.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
+        self.soilm.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.snow.indatabase,
                                                     self.temp.indatabase,
@@ -1250,55 +1217,50 @@ Soil moisture path: {self.soilm.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, "gldas")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        temp_dir = self._scratch_dir
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            for scene in scenes_to_process:
-                if scene not in self.snow.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snow_gldas',
-                                  self.snow.catchment_names, self.snow_log,
-                                  database=self.snow.database,
-                                  pcdatabase=self.snow.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="SWE_inst")
-
-                if scene not in self.temp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'temp_gldas',
-                                  self.temp.catchment_names, self.temp_log,
-                                  database=self.temp.database,
-                                  pcdatabase=self.temp.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="Tair_f_inst")
-
-                if scene not in self.et.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'et_gldas',
-                                  self.et.catchment_names, self.et_log,
-                                  database=self.et.database,
-                                  pcdatabase=self.et.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="ECanop_tavg")
-
-                if scene not in self.soilm.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'soilm_gldas',
-                                  self.soilm.catchment_names, self.soilm_log,
-                                  database=self.soilm.database,
-                                  pcdatabase=self.soilm.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer=["SoilMoi0_10cm_inst",
-                                         "SoilMoi10_40cm_inst",
-                                         "SoilMoi40_100cm_inst",
-                                         "SoilMoi100_200cm_inst"])
+        layers = dict(snow_gldas=dict(layer="SWE_inst",
+                                      scenes=set(scenes_to_process) - self.snow.indatabase,
+                                      catchment_names=self.snow.catchment_names,
+                                      log_file=self.snow_log,
+                                      database=self.snow.database,
+                                      pcdatabase=self.snow.pcdatabase),
+                      temp_gldas=dict(layer="Tair_f_inst",
+                                      scenes=set(scenes_to_process) - self.temp.indatabase,
+                                      catchment_names=self.temp.catchment_names,
+                                      log_file=self.temp_log,
+                                      database=self.temp.database,
+                                      pcdatabase=self.temp.pcdatabase),
+                      et_gldas=dict(layer="ECanop_tavg",
+                                    scenes=set(scenes_to_process) - self.et.indatabase,
+                                    catchment_names=self.et.catchment_names,
+                                    log_file=self.et_log,
+                                    database=self.et.database,
+                                    pcdatabase=self.et.pcdatabase),
+                      soilm_gldas=dict(layer=["SoilMoi0_10cm_inst",
+                                              "SoilMoi10_40cm_inst",
+                                              "SoilMoi40_100cm_inst",
+                                              "SoilMoi100_200cm_inst"],
+                                       scenes=set(scenes_to_process) - self.soilm.indatabase,
+                                       catchment_names=self.soilm.catchment_names,
+                                       log_file=self.soilm_log,
+                                       database=self.soilm.database,
+                                       pcdatabase=self.soilm.pcdatabase))
+
+        # each scene is read once for all the variables missing it
+        scenes = [scene for scene in scenes_to_process
+                  if any(scene in args["scenes"] for args in layers.values())]
+
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_gldas, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, layers, self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -1312,11 +1274,10 @@ Soil moisture path: {self.soilm.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.snow.checkdatabase()
-            self.temp.checkdatabase()
-            self.et.checkdatabase()
-            self.soilm.checkdatabase()
+        self.snow.checkdatabase(verbose=False)
+        self.temp.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
+        self.soilm.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.snow.indatabase,
                                                     self.temp.indatabase,
@@ -1325,8 +1286,6 @@ Soil moisture path: {self.soilm.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, "gldas")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -1334,7 +1293,7 @@ Soil moisture path: {self.soilm.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='gldas',
                               log_file=log_file)
 
@@ -1344,7 +1303,7 @@ Extraction of PERSIANN-CCS 0.04º degree product:
 """
 
 
-class Persiann_ccs:
+class Persiann_ccs(_BaseProduct):
     """
     A class to process PERSIANN-CCS to hidrocl variables
 
@@ -1356,6 +1315,8 @@ class Persiann_ccs:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): common_elements (list): Elements in precipitation database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -1391,30 +1352,12 @@ class Persiann_ccs:
             self.pp = pp
             self.pp_log = pp_log
             self.productname = "PERSIANN-CCS 0.04º"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = self.pp.indatabase
-            self.product_files = t.read_product_files(self.productpath, "persiann_ccs")
-            self.product_ids = t.get_product_ids(self.product_files, "persiann_ccs")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "persiann_ccs")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='persiann_ccs')
+            super().__init__(product_path, "persiann_ccs")
         else:
             raise TypeError('pp must be HidroCLVariable object')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -1429,7 +1372,7 @@ PERSIANN-CCS precipitation records: {len(self.pp.indatabase)}.
 PERSIANN-CCS precipitation database path: {self.pp.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -1437,34 +1380,36 @@ PERSIANN-CCS precipitation database path: {self.pp.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "persiann_ccs")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
 
-            for scene in scenes_to_process:
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, "persiann_ccs",
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath)
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, "persiann_ccs",
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -1478,13 +1423,10 @@ PERSIANN-CCS precipitation database path: {self.pp.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, "persiann_ccs")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -1492,7 +1434,7 @@ PERSIANN-CCS precipitation database path: {self.pp.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='persiann',
                               log_file=log_file)
 
@@ -1502,7 +1444,7 @@ Extraction of PERSIANN-CCS-CDR 0.04º degree product:
 """
 
 
-class Persiann_ccs_cdr:
+class Persiann_ccs_cdr(_BaseProduct):
     """
     A class to process PERSIANN-CCS-CDR to hidrocl variables
 
@@ -1514,6 +1456,8 @@ class Persiann_ccs_cdr:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): common_elements (list): Elements in precipitation database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -1549,30 +1493,12 @@ class Persiann_ccs_cdr:
             self.pp = pp
             self.pp_log = pp_log
             self.productname = "PERSIANN-CCS-CDR 0.04º"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = self.pp.indatabase
-            self.product_files = t.read_product_files(self.productpath, "persiann_ccs_cdr")
-            self.product_ids = t.get_product_ids(self.product_files, "persiann_ccs_cdr")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "persiann_ccs_cdr")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='persiann_ccs_cdr')
+            super().__init__(product_path, "persiann_ccs_cdr")
         else:
             raise TypeError('pp must be HidroCLVariable object')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -1587,7 +1513,7 @@ PERSIANN-CCS-CDR precipitation records: {len(self.pp.indatabase)}.
 PERSIANN-CCS-CDR precipitation database path: {self.pp.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -1595,34 +1521,36 @@ PERSIANN-CCS-CDR precipitation database path: {self.pp.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, 'persiann_ccs_cdr')
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
 
-            for scene in scenes_to_process:
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, "persiann_ccs_cdr",
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath)
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, "persiann_ccs_cdr",
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -1636,13 +1564,10 @@ PERSIANN-CCS-CDR precipitation database path: {self.pp.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, 'persiann_ccs_cdr')
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -1650,7 +1575,7 @@ PERSIANN-CCS-CDR precipitation database path: {self.pp.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='persiann',
                               log_file=log_file)
 
@@ -1659,7 +1584,7 @@ PERSIANN-CCS-CDR precipitation database path: {self.pp.database}
 Extraction of PDIR-NOW 0.04º degree product:
 """
 
-class Pdirnow:
+class Pdirnow(_BaseProduct):
     """
     A class to process PDIR-Now to hidrocl variables
 
@@ -1671,6 +1596,8 @@ class Pdirnow:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): common_elements (list): Elements in precipitation database \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -1706,30 +1633,12 @@ class Pdirnow:
             self.pp = pp
             self.pp_log = pp_log
             self.productname = "PDIR-Now 0.04º"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = self.pp.indatabase
-            self.product_files = t.read_product_files(self.productpath, 'pdirnow')
-            self.product_ids = t.get_product_ids(self.product_files, 'pdirnow')
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, 'pdirnow')
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what='pdirnow')
+            super().__init__(product_path, 'pdirnow')
         else:
             raise TypeError('pp must be HidroCLVariable object')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -1744,7 +1653,7 @@ PDIR-Now precipitation records: {len(self.pp.indatabase)}.
 PDIR-Now precipitation database path: {self.pp.database}
         '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -1752,34 +1661,36 @@ PDIR-Now precipitation database path: {self.pp.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, 'pdirnow')
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
 
-            for scene in scenes_to_process:
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, "pdirnow",
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath)
+        with t.SceneExecutor(workers, threads) as executor:
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, "pdirnow",
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath)
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -1793,13 +1704,10 @@ PDIR-Now precipitation database path: {self.pp.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.pp.checkdatabase()
+        self.pp.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.pp.indatabase, 'pdirnow')
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -1807,7 +1715,7 @@ PDIR-Now precipitation database path: {self.pp.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='persiann',
                               log_file=log_file)
 
@@ -1817,7 +1725,7 @@ Extraction of ERA5-Land hourly data product:
 """
 
 
-class Era5_land:
+class Era5_land(_BaseProduct):
     """
     A class to process ERA5-Land hourly to hidrocl variables. Where:
 
@@ -1857,6 +1765,8 @@ class Era5_land:
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         common_elements (list): List of common elements between the snow, temp, et and soilm databases \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -1948,7 +1858,6 @@ class Era5_land:
             self.snwdt_log = snwdt_log
             self.soilm_log = soilm_log
             self.productname = "ERA5-Land Hourly 0.1 degree"
-            self.productpath = product_path
             self.vectorpath = vector_path
             self.common_elements = t.compare_indatabase(self.temp.indatabase,
                                                         self.pp.indatabase,
@@ -1959,27 +1868,10 @@ class Era5_land:
                                                         self.snwdn.indatabase,
                                                         self.snwdt.indatabase,
                                                         self.soilm.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "era5")
-            self.product_ids = t.get_product_ids(self.product_files, "era5")
-            self.all_scenes = t.check_product_files(self.product_ids)
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "era5")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what="era5")
+            super().__init__(product_path, "era5")
         else:
             raise TypeError('temp, pp, et, pet, snw, snwa, snwdn, snwdt and soilm must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -2018,7 +1910,7 @@ Volumetric soil water records: {len(self.soilm.indatabase)}.
 Volumetric soil water path: {self.soilm.database}
                 '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, batch=16, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -2026,21 +1918,23 @@ Volumetric soil water path: {self.soilm.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            batch (int): number of scenes extracted together in one call to R
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.temp.checkdatabase()
-            self.pp.checkdatabase()
-            self.et.checkdatabase()
-            self.pet.checkdatabase()
-            self.snw.checkdatabase()
-            self.snwa.checkdatabase()
-            self.snwdn.checkdatabase()
-            self.snwdt.checkdatabase()
-            self.soilm.checkdatabase()
+        self.temp.checkdatabase(verbose=False)
+        self.pp.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
+        self.pet.checkdatabase(verbose=False)
+        self.snw.checkdatabase(verbose=False)
+        self.snwa.checkdatabase(verbose=False)
+        self.snwdn.checkdatabase(verbose=False)
+        self.snwdt.checkdatabase(verbose=False)
+        self.soilm.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.temp.indatabase,
                                                     self.pp.indatabase,
@@ -2054,97 +1948,112 @@ Volumetric soil water path: {self.soilm.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, "era5")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
+        temp_dir = self._scratch_dir
 
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
-
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
-            for scene in scenes_to_process:
-                if scene not in self.temp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'temp_era5',
-                                  self.temp.catchment_names, self.temp_log,
-                                  database=self.temp.database,
-                                  pcdatabase=self.temp.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="t2m")
-
-                if scene not in self.pp.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'pp_era5',
-                                  self.pp.catchment_names, self.pp_log,
-                                  database=self.pp.database,
-                                  pcdatabase=self.pp.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="tp")
-
-                if scene not in self.et.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'et_era5',
-                                  self.et.catchment_names, self.et_log,
-                                  database=self.et.database,
-                                  pcdatabase=self.et.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="e")
-
-                if scene not in self.pet.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'pet_era5',
-                                  self.pet.catchment_names, self.pet_log,
-                                  database=self.pet.database,
-                                  pcdatabase=self.pet.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="pev")
-
-                if scene not in self.snw.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snw_era5',
-                                  self.snw.catchment_names, self.snw_log,
-                                  database=self.snw.database,
-                                  pcdatabase=self.snw.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="snowc")
-
-                if scene not in self.snwa.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snwa_era5',
-                                  self.snwa.catchment_names, self.snwa_log,
-                                  database=self.snwa.database,
-                                  pcdatabase=self.snwa.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="asn")
-
-                if scene not in self.snwdn.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snwdn_era5',
-                                  self.snwdn.catchment_names, self.snwdn_log,
-                                  database=self.snwdn.database,
-                                  pcdatabase=self.snwdn.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="rsn")
-
-                if scene not in self.snwdt.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'snwdt_era5',
-                                  self.snwdt.catchment_names, self.snwdt_log,
-                                  database=self.snwdt.database,
-                                  pcdatabase=self.snwdt.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer="sd")
-
-                if scene not in self.soilm.indatabase:
-                    e.zonal_stats(scene, scenes_path,
-                                  temp_dir, 'soilm_era5',
-                                  self.soilm.catchment_names, self.soilm_log,
-                                  database=self.soilm.database,
-                                  pcdatabase=self.soilm.pcdatabase,
-                                  vector_path=self.vectorpath,
-                                  layer=["swvl1", "swvl2", "swvl3", "swvl4"])
+        with t.SceneExecutor(workers, threads) as executor:
+            scenes = [scene for scene in scenes_to_process if scene not in self.temp.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'temp_era5',
+                                self.temp.catchment_names, self.temp_log,
+                                database=self.temp.database,
+                                pcdatabase=self.temp.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="t2m")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.pp.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'pp_era5',
+                                self.pp.catchment_names, self.pp_log,
+                                database=self.pp.database,
+                                pcdatabase=self.pp.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="tp")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.et.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'et_era5',
+                                self.et.catchment_names, self.et_log,
+                                database=self.et.database,
+                                pcdatabase=self.et.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="e")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.pet.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'pet_era5',
+                                self.pet.catchment_names, self.pet_log,
+                                database=self.pet.database,
+                                pcdatabase=self.pet.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="pev")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.snw.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'snw_era5',
+                                self.snw.catchment_names, self.snw_log,
+                                database=self.snw.database,
+                                pcdatabase=self.snw.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="snowc")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.snwa.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'snwa_era5',
+                                self.snwa.catchment_names, self.snwa_log,
+                                database=self.snwa.database,
+                                pcdatabase=self.snwa.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="asn")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.snwdn.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'snwdn_era5',
+                                self.snwdn.catchment_names, self.snwdn_log,
+                                database=self.snwdn.database,
+                                pcdatabase=self.snwdn.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="rsn")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.snwdt.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'snwdt_era5',
+                                self.snwdt.catchment_names, self.snwdt_log,
+                                database=self.snwdt.database,
+                                pcdatabase=self.snwdt.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer="sd")
+
+            scenes = [scene for scene in scenes_to_process if scene not in self.soilm.indatabase]
+            for i in range(0, len(scenes), batch):
+                executor.submit(e.zonal_stats_batch, scenes[i:i + batch],
+                                t.select_scenes_path(self.scenes_files, scenes[i:i + batch]),
+                                temp_dir, 'soilm_era5',
+                                self.soilm.catchment_names, self.soilm_log,
+                                database=self.soilm.database,
+                                pcdatabase=self.soilm.pcdatabase,
+                                vector_path=self.vectorpath,
+                                layer=["swvl1", "swvl2", "swvl3", "swvl4"])
 
     def run_maintainer(self, log_file, limit=None):
         """
@@ -2158,16 +2067,15 @@ Volumetric soil water path: {self.soilm.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.temp.checkdatabase()
-            self.pp.checkdatabase()
-            self.et.checkdatabase()
-            self.pet.checkdatabase()
-            self.snw.checkdatabase()
-            self.snwa.checkdatabase()
-            self.snwdn.checkdatabase()
-            self.snwdt.checkdatabase()
-            self.soilm.checkdatabase()
+        self.temp.checkdatabase(verbose=False)
+        self.pp.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
+        self.pet.checkdatabase(verbose=False)
+        self.snw.checkdatabase(verbose=False)
+        self.snwa.checkdatabase(verbose=False)
+        self.snwdn.checkdatabase(verbose=False)
+        self.snwdt.checkdatabase(verbose=False)
+        self.soilm.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.temp.indatabase,
                                                     self.pp.indatabase,
@@ -2181,8 +2089,6 @@ Volumetric soil water path: {self.soilm.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, "era5")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -2190,7 +2096,7 @@ Volumetric soil water path: {self.soilm.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='era5',
                               log_file=log_file)
 
@@ -2200,7 +2106,7 @@ Extraction of GFS data product:
 """
 
 
-class Gfs:
+class Gfs(_BaseProduct):
     """
     A class to process GFS to hidrocl variables. The used variables are:
     - gh: Geopotential height
@@ -2223,6 +2129,8 @@ class Gfs:
         productpath (str): Path to the product folder where the product files are located \n
         vectorpath (str): Path to the vector folder with Shapefile with areas to be processed \n
         product_files (list): List of product files in the product folder \n
+        scenes_path (list): List of paths to the product files \n
+        scenes_files (dict): Paths to the product files of each scene \n
         product_ids (list): List of product ids. Each product id is str with common tag by date \n
         all_scenes (list): List of all scenes (no matter the product id here) \n
         scenes_occurrences (list): List of scenes occurrences for each product id \n
@@ -2259,33 +2167,13 @@ class Gfs:
             self.variable = variable
             self.aggregation = aggregation
             self.productname = "GFS 0.5º"
-            self.productpath = product_path
             self.vectorpath = vectorpath
             self.common_elements = t.compare_indatabase(self.db0.indatabase, self.db1.indatabase,
                                                         self.db2.indatabase, self.db3.indatabase, self.db4.indatabase)
-            self.product_files = t.read_product_files(self.productpath, "gfs", variable=self.variable)
-            self.product_ids = t.get_product_ids(self.product_files, "gfs")
-
-            self.all_scenes = t.check_product_files(self.product_ids)
-
-            self.scenes_occurrences = t.count_scenes_occurrences(self.all_scenes, self.product_ids)
-            (self.overpopulated_scenes,
-             self.complete_scenes,
-             self.incomplete_scenes) = t.classify_occurrences(self.scenes_occurrences, "gfs")
-            self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes,
-                                                            self.common_elements, what="gfs")
+            super().__init__(product_path, "gfs", variable=self.variable)
         else:
             raise TypeError('db0, db1, db2, db3, db4 must be HidroCLVariable objects')
 
-    def __repr__(self):
-        """
-        Return a string representation of the object
-
-        Returns:
-             str: String representation of the object
-        """
-        return f'Class to extract {self.productname}'
-
     def __str__(self):
         """
         Return a string representation of the object
@@ -2312,7 +2200,7 @@ Database records day4: {len(self.db4.indatabase)}.
 Database path day 4: {self.db4.database}
                 '''
 
-    def run_extraction(self, limit=None):
+    def run_extraction(self, limit=None, workers=1, threads=False):
         """
         Run the extraction of the product.
         If limit is None, all scenes will be processed.
@@ -2320,30 +2208,29 @@ Database path day 4: {self.db4.database}
 
         Args:
             limit (int): length of the scenes_to_process
+            workers (int): number of workers extracting scenes in parallel, None for one per core
+            threads (bool): use worker threads instead of worker processes
 
         Returns:
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.db0.checkdatabase()
-            self.db1.checkdatabase()
-            self.db2.checkdatabase()
-            self.db3.checkdatabase()
-            self.db4.checkdatabase()
+        self.db0.checkdatabase(verbose=False)
+        self.db1.checkdatabase(verbose=False)
+        self.db2.checkdatabase(verbose=False)
+        self.db3.checkdatabase(verbose=False)
+        self.db4.checkdatabase(verbose=False)
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, what="gfs")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
-        with TemporaryDirectory() as tempdirname:
-            temp_dir = Path(tempdirname)
+        temp_dir = self._scratch_dir
 
-            if limit is not None:
-                scenes_to_process = self.scenes_to_process[:limit]
-            else:
-                scenes_to_process = self.scenes_to_process
+        if limit is not None:
+            scenes_to_process = self.scenes_to_process[:limit]
+        else:
+            scenes_to_process = self.scenes_to_process
 
+        with t.SceneExecutor(workers, threads) as executor:
             for scene in scenes_to_process:
                 days = []
                 if scene not in self.db0.indatabase:
@@ -2357,25 +2244,25 @@ Database path day 4: {self.db4.database}
                 if scene not in self.db4.indatabase:
                     days.append(4)
 
-                e.zonal_stats(scene, scenes_path,
-                              temp_dir, 'gfs',
-                              self.db0.catchment_names, self.db_log,
-                              database=None,
-                              databases=[self.db0.database,
-                                         self.db1.database,
-                                         self.db2.database,
-                                         self.db3.database,
-                                         self.db4.database],
-                              pcdatabase=None,
-                              pcdatabases=[self.db0.pcdatabase,
-                                           self.db1.pcdatabase,
-                                           self.db2.pcdatabase,
-                                           self.db3.pcdatabase,
-                                           self.db4.pcdatabase],
-                              vector_path=self.vectorpath,
-                              layer=self.variable,
-                              aggregation=self.aggregation,
-                              days=days)
+                executor.submit(e.zonal_stats, scene, self.scenes_files[scene],
+                                temp_dir, 'gfs',
+                                self.db0.catchment_names, self.db_log,
+                                database=None,
+                                databases=[self.db0.database,
+                                           self.db1.database,
+                                           self.db2.database,
+                                           self.db3.database,
+                                           self.db4.database],
+                                pcdatabase=None,
+                                pcdatabases=[self.db0.pcdatabase,
+                                             self.db1.pcdatabase,
+                                             self.db2.pcdatabase,
+                                             self.db3.pcdatabase,
+                                             self.db4.pcdatabase],
+                                vector_path=self.vectorpath,
+                                layer=self.variable,
+                                aggregation=self.aggregation,
+                                days=days)
 
 
     def run_maintainer(self, log_file, limit=None):
@@ -2390,16 +2277,15 @@ Database path day 4: {self.db4.database}
             str: Print
         """
 
-        with t.HiddenPrints():
-            self.temp.checkdatabase()
-            self.pp.checkdatabase()
-            self.et.checkdatabase()
-            self.pet.checkdatabase()
-            self.snw.checkdatabase()
-            self.snwa.checkdatabase()
-            self.snwdn.checkdatabase()
-            self.snwdt.checkdatabase()
-            self.soilm.checkdatabase()
+        self.temp.checkdatabase(verbose=False)
+        self.pp.checkdatabase(verbose=False)
+        self.et.checkdatabase(verbose=False)
+        self.pet.checkdatabase(verbose=False)
+        self.snw.checkdatabase(verbose=False)
+        self.snwa.checkdatabase(verbose=False)
+        self.snwdn.checkdatabase(verbose=False)
+        self.snwdt.checkdatabase(verbose=False)
+        self.soilm.checkdatabase(verbose=False)
 
         self.common_elements = t.compare_indatabase(self.temp.indatabase,
                                                     self.pp.indatabase,
@@ -2413,8 +2299,6 @@ Database path day 4: {self.db4.database}
 
         self.scenes_to_process = t.get_scenes_out_of_db(self.complete_scenes, self.common_elements, "era5")
 
-        scenes_path = t.get_scenes_path(self.product_files, self.productpath)
-
         if limit is not None:
             scenes_to_process = self.scenes_to_process[:limit]
         else:
@@ -2422,6 +2306,6 @@ Database path day 4: {self.db4.database}
 
         for scene in scenes_to_process:
             m.file_maintainer(scene=scene,
-                              scenes_path=scenes_path,
+                              scenes_path=self.scenes_files[scene],
                               name='era5',
                               log_file=log_file)
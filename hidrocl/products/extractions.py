@@ -5,11 +5,15 @@ import gc
 import re
 import csv
 import time
+import fcntl
+import threading
 import xarray
+import rasterio
 import subprocess
 import numpy as np
 import pandas as pd
 from math import ceil
+from functools import wraps
 from array import array
 from . import tools as t
 from sys import platform
@@ -28,6 +32,35 @@ elif platform == "darwin":
 # elif platform == "win32":
 # Windows...
 
+# flock on NFS mounts falls back to POSIX locks, which are held per process,
+# so worker threads of one process also share this lock before writing
+_write_lock = threading.Lock()
+
+# GDAL decodes and compresses raster blocks with its own threads, and its
+# block cache is capped since each scene is read only once
+GDAL_CACHEMAX = 256
+
+
+def gdal_env(func):
+    """
+    Decorator to run an extraction function with GDAL threads and block cache
+    set. GDAL_NUM_THREADS is read from the environment on each call, so
+    tools.SceneExecutor can share the cores among its workers, and it is
+    ALL_CPUS when it is not set
+
+    Args:
+        func (function): extraction function
+
+    Returns:
+        function: decorated function
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with rasterio.Env(GDAL_NUM_THREADS=os.environ.get('GDAL_NUM_THREADS', 'ALL_CPUS'),
+                          GDAL_CACHEMAX=GDAL_CACHEMAX):
+            return func(*args, **kwargs)
+    return wrapper
+
 
 def load_hdf5(file, var):
     """
@@ -64,10 +97,26 @@ def load_nc(file, var):
         xarray.DataArray: xarray DataArray
     """
 
+    return load_nc_layers(file, [var])[0]
+
+
+def load_nc_layers(file, variables):
+    """
+    Load several variables from the same .nc file of GLDAS product,
+    opening the file only once
+
+    Args:
+        file (str): file path
+        variables (list): variables to extract
+
+    Returns:
+        list: xarray.DataArray with each variable, in the same order
+    """
+
     with t.HiddenPrints():
-        da = xarray.open_dataset(file, engine="netcdf4")
-        da = da[var]
-        return da.sel(lat=slice(-55, -15), lon=slice(-75, -65))
+        with xarray.open_dataset(file, engine="netcdf4") as ds:
+            return [ds[var].sel(lat=slice(-55, -15), lon=slice(-75, -65)).load()
+                    for var in variables]
 
 
 def load_era5(file, var, reducer='mean'):
@@ -83,71 +132,90 @@ def load_era5(file, var, reducer='mean'):
         xarray.DataArray: xarray.DataArray with the variable
     """
 
-    with t.HiddenPrints():
-        da = xarray.open_dataset(file, mask_and_scale=True)
-        da = da[var]
-        match reducer:
-            case 'mean':
-                da = da.mean(dim='time')
-            case 'sum':
-                da = da.sum(dim='time')
-            case _:
-                raise ValueError("Reducer not supported")
-        match var:
-            case 't2m':
-                da = da - 273.15
-            case _:
-                pass
-        return da
+    return load_era5_layers(file, [var], reducer)[0]
 
 
-def load_persiann(file):
+def load_era5_layers(file, variables, reducer='mean'):
     """
-    Load .bin persiann files
+    Load several variables from the same .nc file of ERA5 product,
+    opening the file only once
 
     Args:
         file (str): file path
+        variables (list): variables to extract
+        reducer (str): reducer to use
 
     Returns:
-        xarray.DataArray: xarray.DataArray with the variable
+        list: xarray.DataArray with each variable, in the same order
     """
+
+    if reducer not in ('mean', 'sum'):
+        raise ValueError("Reducer not supported")
+
+    layers = []
     with t.HiddenPrints():
-        da = open(file, 'rb')
+        # times are only reduced over, so they are not decoded
+        with xarray.open_dataset(file, mask_and_scale=True, decode_times=False) as ds:
+            for var in variables:
+                match reducer:
+                    case 'mean':
+                        da = ds[var].mean(dim='time')
+                    case 'sum':
+                        da = ds[var].sum(dim='time')
+                match var:
+                    case 't2m':
+                        da = da - 273.15
+                    case _:
+                        pass
+                layers.append(da)
+    return layers
 
-        nlon = 9000
-        nlat = 3000
-        flon = 0.02
-        slon = 0.04
-        llon = 359.99
-        flat = 59.98  # N
-        slat = -0.04
-        llat = -59.99  # S
 
-        lon = np.arange(flon, llon, slon)
-        lat = np.arange(flat, llat, slat)
+def load_persiann(file):
+    """
+    Load .bin persiann files
 
-        bytesize = 4
-        overhead = 0
-        recl = (nlon * nlat + overhead) * bytesize
+    Args:
+        file (str): file path
 
+    Returns:
+        xarray.DataArray: xarray.DataArray with the variable
+    """
+    nlon = 9000
+    nlat = 3000
+    flon = 0.02
+    slon = 0.04
+    llon = 359.99
+    flat = 59.98  # N
+    slat = -0.04
+    llat = -59.99  # S
+
+    lon = np.arange(flon, llon, slon)
+    lat = np.arange(flat, llat, slat)
+
+    bytesize = 4
+    overhead = 0
+    recl = (nlon * nlat + overhead) * bytesize
+
+    with open(file, 'rb') as da:
         tmp = array('f', da.read(recl))
 
-        data = np.reshape(tmp, (nlat, nlon))
-        data[data < -1000] = np.nan
+    data = np.reshape(tmp, (nlat, nlon))
+    data[data < -1000] = np.nan
 
-        persiann = xarray.DataArray(data,
-                                    coords={'lat': lat,
-                                            'lon': lon},
-                                    dims=['lat', 'lon'],
-                                    attrs=dict(
-                                        description='Precipitation',
-                                        units='mm'
-                                    ))
+    persiann = xarray.DataArray(data,
+                                coords={'lat': lat,
+                                        'lon': lon},
+                                dims=['lat', 'lon'],
+                                attrs=dict(
+                                    description='Precipitation',
+                                    units='mm'
+                                ))
 
-        persiann.coords['lon'] = (persiann.coords['lon'] + 180) % 360 - 180
-        return persiann.sortby(persiann.lon)\
-            .sortby(persiann.lat).sel(lat=slice(-55, -15), lon=slice(-75, -65))\
-            .rename({'lon': 'x', 'lat': 'y'})
+    persiann.coords['lon'] = (persiann.coords['lon'] + 180) % 360 - 180
+    return persiann.sortby(persiann.lon)\
+        .sortby(persiann.lat).sel(lat=slice(-55, -15), lon=slice(-75, -65))\
+        .rename({'lon': 'x', 'lat': 'y'})
 
 
 def load_gfs(file, var, day=0):
@@ -166,10 +234,10 @@ def load_gfs(file, var, day=0):
     with t.HiddenPrints():
         da = xarray.open_dataset(file, mask_and_scale=True)
         da = da[var]
-        da.load()
         da = da.sel(valid_time=slice(da.time+pd.to_timedelta(24*day, unit='H'),
                                      da.time+pd.to_timedelta(24*day + 23, unit='H')))\
             .transpose('valid_time', 'latitude', 'longitude')
+        da.load()
         da.coords['longitude'] = (da.coords['longitude'] + 180) % 360 - 180
         return da
 
@@ -202,10 +270,10 @@ def sum_datasets(dataset_list):
     Returns:
         xarray.Dataset: xarray dataset with the sum of the datasets
     """
-    template = dataset_list[0].copy()
-    sum_values = sum([d.values for d in dataset_list])
-    template.values = sum_values
-    return template
+    sum_values = dataset_list[0].values.copy()
+    for d in dataset_list[1:]:
+        np.add(sum_values, d.values, out=sum_values)
+    return dataset_list[0].copy(data=sum_values)
 
 
 def mean_datasets(dataset_list):
@@ -218,10 +286,14 @@ def mean_datasets(dataset_list):
     Returns:
         xarray.Dataset: xarray dataset with the mean of the datasets
     """
-    template = dataset_list[0].copy()
-    mean_values = np.mean([d.values for d in dataset_list], axis=0)
-    template.values = mean_values
-    return template
+    first = dataset_list[0].values
+    # running sum, so the datasets are never stacked into one (n, y, x) array
+    dtype = first.dtype if np.issubdtype(first.dtype, np.floating) else np.float64
+    mean_values = first.astype(dtype, copy=True)
+    for d in dataset_list[1:]:
+        np.add(mean_values, d.values, out=mean_values)
+    mean_values /= len(dataset_list)
+    return dataset_list[0].copy(data=mean_values)
 
 
 def max_datasets(dataset_list):
@@ -234,10 +306,10 @@ def max_datasets(dataset_list):
     Returns:
         xarray.Dataset: xarray dataset with the max of the datasets
     """
-    template = dataset_list[0].copy()
-    max_values = np.max([d.values for d in dataset_list], axis=0)
-    template.values = max_values
-    return template
+    max_values = dataset_list[0].values.copy()
+    for d in dataset_list[1:]:
+        np.maximum(max_values, d.values, out=max_values)
+    return dataset_list[0].copy(data=max_values)
 
 
 def mosaic_raster(raster_list, layer):
@@ -283,7 +355,7 @@ def mosaic_nd_raster(raster_list, layer1, layer2):
             lyr1 = getattr(src, layer1)
             lyr2 = getattr(src, layer2)
             nd = 1000 * (lyr1 - lyr2) / (lyr1 + lyr2)
-            nd.rio.set_nodata(-32768)
+            nd = nd.rio.write_nodata(-32768)
             raster_single.append(nd)
     raster_mosaic = merge_arrays(raster_single)
     raster_mosaic = raster_mosaic.where((raster_mosaic <= 1000) & (raster_mosaic >= -1000))
@@ -291,6 +363,86 @@ def mosaic_nd_raster(raster_list, layer1, layer2):
     return raster_mosaic
 
 
+def mosaic_layers(raster_list, layers):
+    """
+    Function to compute mosaics of several layers with rioxarray library,
+    opening every file once. A list of two layers gives their normalized
+    difference, computed as in mosaic_nd_raster.
+
+    Args:
+        raster_list (list): list of raster files
+        layers (dict): with names as keys and layer (str) or pair of layers (list) to mosaic as values
+
+    Returns:
+        dict: xarray DataArray with the mosaic for each name
+    """
+    raster_single = {name: [] for name in layers}
+    variables = list(dict.fromkeys(lyr for layer in layers.values()
+                                   for lyr in ([layer] if isinstance(layer, str) else layer)))
+
+    for raster in raster_list:
+        with rioxr.open_rasterio(raster, masked=True) as src:
+            # layers are read before the file is closed, otherwise merge_arrays
+            # would open it again for each of them
+            bands = {lyr: src[lyr].load() for lyr in variables}
+        for name, layer in layers.items():
+            if isinstance(layer, list):
+                lyr1 = bands[layer[0]]
+                lyr2 = bands[layer[1]]
+                nd = 1000 * (lyr1 - lyr2) / (lyr1 + lyr2)
+                nd = nd.rio.write_nodata(-32768)
+                raster_single[name].append(nd)
+            else:
+                raster_single[name].append(bands[layer])
+
+    raster_mosaics = {}
+    for name, layer in layers.items():
+        raster_mosaic = merge_arrays(raster_single[name])
+        if isinstance(layer, list):
+            raster_mosaic = raster_mosaic.where((raster_mosaic <= 1000) & (raster_mosaic >= -1000))
+            raster_mosaic = raster_mosaic.where(raster_mosaic != raster_mosaic.rio.nodata)
+        raster_mosaics[name] = raster_mosaic
+    return raster_mosaics
+
+
+def crop_to_vector(mos, vector_path):
+    """
+    Function to crop a mosaic to the bounding box of the vector file, padded
+    by one pixel, so the temporary raster only holds what will be extracted
+
+    Args:
+        mos (xarray.DataArray): mosaic to crop
+        vector_path (str): vector path, with the same CRS than the mosaic
+
+    Returns:
+        xarray.DataArray: cropped mosaic, or the same mosaic if the vector bounds are unknown
+    """
+    bounds = t.vector_bounds(vector_path)
+    if bounds is None:
+        return mos
+    minx, miny, maxx, maxy = bounds
+    xres, yres = (abs(value) for value in mos.rio.resolution())
+    try:
+        return mos.rio.clip_box(minx - xres, miny - yres, maxx + xres, maxy + yres)
+    except rxre.NoDataInBounds:
+        return mos
+
+
+def coverage_cache(tempfolder, vector_path):
+    """
+    Path of the file where WeightedMeanExtraction.R keeps the cells covered
+    by each polygon of a vector, to reuse them between calls
+
+    Args:
+        tempfolder (str): temporary folder path
+        vector_path (str): vector path
+
+    Returns:
+        str: cache file path
+    """
+    return os.path.join(tempfolder, f"coverage_{os.path.basename(vector_path)}.rds")
+
+
 def write_line(database, result, catchment_names, file_id, file_date, ncol=1):
     """
     Write line to database
@@ -303,30 +455,52 @@ def write_line(database, result, catchment_names, file_id, file_date, ncol=1):
         file_date (str): file date
         ncol (int): number of columns
 
+    Returns:
+        None
+    """
+    write_lines(database, result, catchment_names, [file_id], [file_date], [ncol])
+
+
+def write_lines(database, result, catchment_names, file_ids, file_dates, ncols):
+    """
+    Write several lines to database, one per column of the result file,
+    reading the result once and appending all lines with a single write
+
+    Args:
+        database (str): database path
+        result (str): result file path
+        catchment_names (list): list of catchment names
+        file_ids (list): file id of each line
+        file_dates (list): file date of each line
+        ncols (list): result column of each line
+
     Returns:
         None
     """
     with open(result) as csv_file:
         csvreader = csv.reader(csv_file, delimiter=',')
-        gauge_id_result = []
-        value_result = []
-        for row in csvreader:
-            gauge_id_result.append(row[0])
-            value_result.append(row[ncol])
-    gauge_id_result = [value for value in gauge_id_result[1:]]
-    value_result = [str(ceil(float(value))) if
-                    value.replace('.', '', 1).lstrip("-").isdigit() else
-                    'NA' for value in
-                    value_result[1:] if value]
-
-    if catchment_names == gauge_id_result:
+        next(csvreader, None)  # skip header
+        rows = list(csvreader)
+    gauge_id_result = [row[0] for row in rows]
+
+    if catchment_names != gauge_id_result:
+        print('Inconsistencies with gauge ids!')
+        return
+
+    data_lines = []
+    for file_id, file_date, ncol in zip(file_ids, file_dates, ncols):
+        value_result = [str(ceil(float(value))) if
+                        value.replace('.', '', 1).lstrip("-").isdigit() else
+                        'NA' for value in
+                        (row[ncol] for row in rows) if value]
         value_result.insert(0, file_id)
         value_result.insert(1, file_date)
-        data_line = ','.join(value_result) + '\n'
-        with open(database, 'a') as the_file:
-            the_file.write(data_line)
-    else:
-        print('Inconsistencies with gauge ids!')
+        data_lines.append(','.join(value_result) + '\n')
+
+    with _write_lock, open(database, 'a') as the_file:
+        # scenes may be extracted by several processes at once
+        fcntl.flock(the_file, fcntl.LOCK_EX)
+        the_file.write(''.join(data_lines))
 
 
 def write_log(log_file, file_id, currenttime, time_dif, database):
@@ -343,45 +517,26 @@ def write_log(log_file, file_id, currenttime, time_dif, database):
     Returns:
         None
     """
-    with open(log_file, 'a') as txt_file:
+    with _write_lock, open(log_file, 'a') as txt_file:
+        fcntl.flock(txt_file, fcntl.LOCK_EX)
         txt_file.write(f'ID {file_id}. Date: {currenttime}. Process time: {time_dif} s. Database: {database}. \n')
 
 
-def zonal_stats(scene, scenes_path, tempfolder, name,
-                catchment_names, log_file, **kwargs):
+def load_scene(scene, scenes_path, name, **kwargs):
     """
-    Function to extract zonal statistics from raster files
+    Function to load the files of a scene as a single mosaic ready for extraction
 
     Args:
         scene (str): scene name
         scenes_path (str): path where scenes are
-        tempfolder (str): temporary folder path
         name (str): product name
-        catchment_names (list): catchment names
-        log_file (str): log file path
-        **kwargs: additional arguments
+        **kwargs: additional arguments, as in zonal_stats
 
-    Keyword Args:
-        database (str): Database path
-        pcdatabase (str): pcdatabase path
-        north_database (str): North database path
-        south_database (str): South database path
-        north_pcdatabase (str): North pcdatabase path
-        south_pcdatabase (str): South pcdatabase path
-        vector_path (str): vector path
-        north_vector_path (str): north vector path
-        south_vector_path (str): south vector path
-        layer (Union[str,list]): with layer/layers to extract
-        *** Add GFS kwargs ***
-        gfs_path (str): GFS path
     Returns:
-        Print
+        tuple: xarray DataArray with the mosaic and the file date, or None if the scene could not be loaded
     """
-
-    print(f'Processing scene {scene} for {name}')
     r = re.compile('.*' + str(scene) + '.*')
     selected_files = list(filter(r.match, scenes_path))
-    start = time.time()
     match name:
         case "imerg":
             file_date = datetime.strptime(scene, '%Y%m%d').strftime('%Y-%m-%d')
@@ -458,15 +613,15 @@ def zonal_stats(scene, scenes_path, tempfolder, name,
                         else:
                             print("aggregation argument must be sum, mean or max, and it's needed")
                             return None
-                        # scale and unit conversions
-                        if kwargs.get("layer") == 'prate':
-                            mos_pre = mos_pre * 3600 * 30
-                        if kwargs.get("layer") == 'gh':
-                            pass
-                        if kwargs.get("layer") == 't2m':
-                            mos_pre = (mos_pre - 273.15)*10
-                        else:
-                            mos_pre = mos_pre * 10
+                        # scale and unit conversions, with the x10 database scaling folded into
+                        # a single pass over the grid
+                        match kwargs.get("layer"):
+                            case 'prate':
+                                mos_pre = mos_pre * (3600 * 30 * 10)
+                            case 't2m':
+                                mos_pre = (mos_pre - 273.15) * 10
+                            case _:
+                                mos_pre = mos_pre * 10
                         mos_list.append(mos_pre)
                 mos = xarray.Dataset()
 
@@ -533,11 +688,7 @@ def zonal_stats(scene, scenes_path, tempfolder, name,
                     if isinstance(kwargs.get("layer"), list):
                         lyrs = kwargs.get("layer")
                         try:
-                            layers_list = []
-                            for lyr in lyrs:
-                                file = selected_files[0]
-                                dataset = load_era5(file, lyr, "mean")
-                                layers_list.append(dataset)
+                            layers_list = load_era5_layers(selected_files[0], lyrs, "mean")
                             mos = sum_datasets(layers_list)
                             mos = mos * 1000
                         except (OSError, ValueError):
@@ -571,10 +722,322 @@ def zonal_stats(scene, scenes_path, tempfolder, name,
             except (rxre.RioXarrayError, rioe.RasterioIOError):
                 return print(f"Error in scene {scene}")
 
-    temporal_raster = os.path.join(tempfolder, name + "_" + scene + ".tif")
+    return mos, file_date
+
+
+@gdal_env
+def zonal_stats(scene, scenes_path, tempfolder, name,
+                catchment_names, log_file, **kwargs):
+    """
+    Function to extract zonal statistics from raster files
+
+    Args:
+        scene (str): scene name
+        scenes_path (str): path where scenes are
+        tempfolder (str): temporary folder path
+        name (str): product name
+        catchment_names (list): catchment names
+        log_file (str): log file path
+        **kwargs: additional arguments
+
+    Keyword Args:
+        database (str): Database path
+        pcdatabase (str): pcdatabase path
+        north_database (str): North database path
+        south_database (str): South database path
+        north_pcdatabase (str): North pcdatabase path
+        south_pcdatabase (str): South pcdatabase path
+        vector_path (str): vector path
+        north_vector_path (str): north vector path
+        south_vector_path (str): south vector path
+        layer (Union[str,list]): with layer/layers to extract
+        *** Add GFS kwargs ***
+        gfs_path (str): GFS path
+    Returns:
+        Print
+    """
+
+    print(f'Processing scene {scene} for {name}')
+    start = time.time()
+    loaded = load_scene(scene, scenes_path, name, **kwargs)
+    if loaded is None:
+        return
+    mos, file_date = loaded
+    extract_mosaic(mos, scene, tempfolder, name, catchment_names, log_file,
+                   file_date, start, **kwargs)
+
+
+@gdal_env
+def zonal_stats_batch(scenes, scenes_path, tempfolder, name,
+                      catchment_names, log_file, **kwargs):
+    """
+    Function to extract zonal statistics of several scenes at once. The scene
+    mosaics are stacked as bands of one raster, so R is started, the vector is
+    read and the cells covered by each catchment are computed once per batch.
+    Only for products extracted with WeightedMeanExtraction.R (not snow or gfs)
+
+    Args:
+        scenes (list): scene names
+        scenes_path (str): path where scenes are
+        tempfolder (str): temporary folder path
+        name (str): product name
+        catchment_names (list): catchment names
+        log_file (str): log file path
+        **kwargs: additional arguments, as in zonal_stats
+
+    Returns:
+        Print
+    """
+
+    start = time.time()
+    loaded_scenes = []
+    file_dates = []
+    mosaics = []
+    for scene in scenes:
+        print(f'Processing scene {scene} for {name}')
+        loaded = load_scene(scene, scenes_path, name, **kwargs)
+        if loaded is None:
+            continue
+        mos, file_date = loaded
+        if mos.ndim == 3 and mos.shape[0] == 1:
+            mos = mos.squeeze(mos.dims[0], drop=True)
+        loaded_scenes.append(scene)
+        file_dates.append(file_date)
+        mosaics.append(mos)
+
+    if not mosaics:
+        return
+
+    try:
+        mos = xarray.concat(mosaics, dim='band', join='exact')
+    except ValueError:
+        print('Scenes do not share the same grid, extracting them one by one')
+        for scene in loaded_scenes:
+            zonal_stats(scene, scenes_path, tempfolder, name, catchment_names, log_file, **kwargs)
+        return
+
+    nscenes = len(loaded_scenes)
+    worker = f"{os.getpid()}_{threading.get_ident()}"
+    temporal_raster = os.path.join(tempfolder, f"{name}_{loaded_scenes[0]}_{nscenes}_{worker}.tif")
+    result_file = os.path.join(tempfolder, f"{name}_{loaded_scenes[0]}_{nscenes}_{worker}.csv")
+    mos = crop_to_vector(mos, kwargs.get("vector_path"))
+    mos.rio.to_raster(temporal_raster, compress="LZW")
+    subprocess.call([rscript,
+                     "--vanilla",
+                     "./hidrocl/products/Rfiles/WeightedMeanExtraction.R",
+                     kwargs.get("vector_path"),
+                     temporal_raster,
+                     result_file,
+                     coverage_cache(tempfolder, kwargs.get("vector_path"))])
+
+    end = time.time()
+    time_dif = str(round((end - start) / nscenes))
+    currenttime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    # results have one mean column per scene followed by one pc column per scene
+    write_lines(kwargs.get("database"), result_file, catchment_names, loaded_scenes, file_dates,
+                [i + 1 for i in range(nscenes)])
+    write_lines(kwargs.get("pcdatabase"), result_file, catchment_names, loaded_scenes, file_dates,
+                [i + 1 + nscenes for i in range(nscenes)])
+    for scene in loaded_scenes:
+        write_log(log_file, scene, currenttime, time_dif, kwargs.get("database"))
+    print(f"Time elapsed for {nscenes} scenes: {str(round(end - start))} seconds")
+    os.remove(temporal_raster)
+    os.remove(result_file)
+    gc.collect()
+
+
+@gdal_env
+def zonal_stats_multilayer(scene, scenes_path, tempfolder, layers, vector_path):
+    """
+    Function to extract zonal statistics of several layers of a MODIS scene,
+    reading the scene files once for all of them
+
+    Args:
+        scene (str): scene name
+        scenes_path (str): path where scenes are
+        tempfolder (str): temporary folder path
+        layers (dict): with product names as keys and dicts as values, each with
+            layer (Union[str,list]), catchment_names (list), log_file (str),
+            database (str) and pcdatabase (str)
+        vector_path (str): vector path
+
+    Returns:
+        Print
+    """
+
+    print(f'Processing scene {scene} for {", ".join(layers)}')
+    r = re.compile('.*' + str(scene) + '.*')
+    selected_files = list(filter(r.match, scenes_path))
+    start = time.time()
+    file_date = datetime.strptime(scene, 'A%Y%j').strftime('%Y-%m-%d')
+
+    try:
+        mosaics = mosaic_layers(selected_files, {name: args["layer"] for name, args in layers.items()})
+    except (rxre.RioXarrayError, rioe.RasterioIOError):
+        return print(f"Error in scene {scene}")
+
+    for name, args in layers.items():
+        mos = mosaics[name]
+        if isinstance(args["layer"], str):
+            mos = mos * 0.1
+        extract_mosaic(mos, scene, tempfolder, name, args["catchment_names"], args["log_file"],
+                       file_date, start, database=args["database"], pcdatabase=args["pcdatabase"],
+                       vector_path=vector_path, layer=args["layer"])
+        start = time.time()
+
+
+def load_gldas_layers(scene, scenes_path, layers):
+    """
+    Function to load the mosaics of several GLDAS variables of a scene,
+    reading each file of the scene once for all of them
+
+    Args:
+        scene (str): scene name
+        scenes_path (str): path where scenes are
+        layers (dict): with product names as keys and layers (Union[str,list]) as values.
+            The layers of a list are summed, as for soil moisture
+
+    Returns:
+        dict: xarray DataArray with the mosaic of each product name
+    """
+    r = re.compile('.*' + str(scene) + '.*')
+    selected_files = list(filter(r.match, scenes_path))
+    lyrs = {name: [layer] if isinstance(layer, str) else layer for name, layer in layers.items()}
+    variables = list(dict.fromkeys(lyr for layer in lyrs.values() for lyr in layer))
+    files_layers = [dict(zip(variables, load_nc_layers(ds, variables))) for ds in selected_files]
+
+    mosaics = {}
+    for name, layer in lyrs.items():
+        layers_list = [mean_datasets([ds[lyr] for ds in files_layers]) for lyr in layer]
+        if len(layers_list) == 1:
+            mos = layers_list[0]
+        else:
+            mos = sum_datasets(layers_list)
+        mosaics[name] = mos * 100
+    return mosaics
+
+
+@gdal_env
+def zonal_stats_gldas(scenes, scenes_path, tempfolder, layers, vector_path):
+    """
+    Function to extract zonal statistics of several GLDAS variables of several
+    scenes at once. Each scene file is read once for all the variables, and the
+    mosaics of every variable and scene are stacked as bands of one raster, so
+    R is started once per call
+
+    Args:
+        scenes (list): scene names
+        scenes_path (str): path where scenes are
+        tempfolder (str): temporary folder path
+        layers (dict): with product names as keys and dicts as values, each with
+            layer (Union[str,list]), scenes (set) not yet in its database,
+            catchment_names (list), log_file (str), database (str) and pcdatabase (str)
+        vector_path (str): vector path
+
+    Returns:
+        Print
+    """
+
+    start = time.time()
+    bands = []
+    mosaics = []
+    for scene in scenes:
+        needed = {name: args["layer"] for name, args in layers.items() if scene in args["scenes"]}
+        if not needed:
+            continue
+        print(f'Processing scene {scene} for {", ".join(needed)}')
+        file_date = datetime.strptime(scene, 'A%Y%m%d').strftime('%Y-%m-%d')
+        try:
+            loaded = load_gldas_layers(scene, scenes_path, needed)
+        except OSError:
+            print(f"Error in scene {scene}")
+            continue
+        for name, mos in loaded.items():
+            if mos.ndim == 3 and mos.shape[0] == 1:
+                mos = mos.squeeze(mos.dims[0], drop=True)
+            bands.append((name, scene, file_date))
+            mosaics.append(mos)
+
+    if not mosaics:
+        return
+
+    try:
+        mos = xarray.concat(mosaics, dim='band', join='exact')
+    except ValueError:
+        print('Scenes do not share the same grid, extracting them one by one')
+        for (name, scene, file_date), mos in zip(bands, mosaics):
+            args = layers[name]
+            extract_mosaic(mos, scene, tempfolder, name, args["catchment_names"], args["log_file"],
+                           file_date, time.time(), database=args["database"],
+                           pcdatabase=args["pcdatabase"], vector_path=vector_path)
+        return
+
+    nbands = len(bands)
+    worker = f"{os.getpid()}_{threading.get_ident()}"
+    temporal_raster = os.path.join(tempfolder, f"gldas_{bands[0][1]}_{nbands}_{worker}.tif")
+    result_file = os.path.join(tempfolder, f"gldas_{bands[0][1]}_{nbands}_{worker}.csv")
+    mos = crop_to_vector(mos, vector_path)
+    mos.rio.to_raster(temporal_raster, compress="LZW")
+    subprocess.call([rscript,
+                     "--vanilla",
+                     "./hidrocl/products/Rfiles/WeightedMeanExtraction.R",
+                     vector_path,
+                     temporal_raster,
+                     result_file,
+                     coverage_cache(tempfolder, vector_path)])
+
+    end = time.time()
+    nscenes = len({scene for _, scene, _ in bands})
+    time_dif = str(round((end - start) / nscenes))
+    currenttime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    # results have one mean column per band followed by one pc column per band
+    for name, args in layers.items():
+        cols = [i for i, band in enumerate(bands) if band[0] == name]
+        if not cols:
+            continue
+        band_scenes = [bands[i][1] for i in cols]
+        band_dates = [bands[i][2] for i in cols]
+        write_lines(args["database"], result_file, args["catchment_names"], band_scenes, band_dates,
+                    [i + 1 for i in cols])
+        write_lines(args["pcdatabase"], result_file, args["catchment_names"], band_scenes, band_dates,
+                    [i + 1 + nbands for i in cols])
+        for scene in band_scenes:
+            write_log(args["log_file"], scene, currenttime, time_dif, args["database"])
+    print(f"Time elapsed for {nscenes} scenes: {str(round(end - start))} seconds")
+    os.remove(temporal_raster)
+    os.remove(result_file)
+    gc.collect()
+
+
+def extract_mosaic(mos, scene, tempfolder, name, catchment_names, log_file,
+                   file_date, start, **kwargs):
+    """
+    Function to write a mosaic to a temporary raster, extract its zonal statistics
+    and write them to the databases
+
+    Args:
+        mos (xarray.DataArray): mosaic to extract
+        scene (str): scene name
+        tempfolder (str): temporary folder path
+        name (str): product name
+        catchment_names (list): catchment names
+        log_file (str): log file path
+        file_date (str): file date
+        start (float): time when the scene processing started
+        **kwargs: additional arguments, as in zonal_stats
+
+    Returns:
+        None
+    """
+
+    # the process and thread ids keep names apart when two variables with the
+    # same name (pet and et) are extracted at once by different workers
+    worker = f"{os.getpid()}_{threading.get_ident()}"
+    temporal_raster = os.path.join(tempfolder, f"{name}_{scene}_{worker}.tif")
     # temporal_raster = os.path.join("/Users/aldotapia/hidrocl_test/", name + "_" + scene + ".tif")
     # result_file = os.path.join("/Users/aldotapia/hidrocl_test/", name + "_" + scene + ".csv")
-    result_file = os.path.join(tempfolder, name + "_" + scene + ".csv")
+    result_file = os.path.join(tempfolder, f"{name}_{scene}_{worker}.csv")
+    mos = crop_to_vector(mos, kwargs.get("vector_path"))
     mos.rio.to_raster(temporal_raster, compress="LZW")
     match name:
         case 'snow':
@@ -641,7 +1104,8 @@ def zonal_stats(scene, scenes_path, tempfolder, name,
                              "./hidrocl/products/Rfiles/WeightedMeanExtraction.R",
                              kwargs.get("vector_path"),
                              temporal_raster,
-                             result_file])
+                             result_file,
+                             coverage_cache(tempfolder, kwargs.get("vector_path"))])
 
             write_line(kwargs.get("database"), result_file, catchment_names, scene, file_date, ncol=1)
             write_line(kwargs.get("pcdatabase"), result_file, catchment_names, scene, file_date, ncol=2)
@@ -2,8 +2,17 @@
 
 import os
 import sys
-from pathlib import Path
-from functools import reduce
+import time
+import shutil
+import struct
+import pickle
+import hashlib
+import weakref
+import threading
+import tempfile
+from functools import lru_cache
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from ..variables import HidroCLVariable
 
 
@@ -11,22 +20,60 @@ def compare_indatabase(*args):
     """
     Function to compare if a variable is in a database.
 
-    :param args: lists of indatabase to compare
+    :param args: lists (or sets) of indatabase to compare
     :return: list
     """
     for arg in args:
-        if isinstance(arg, list):
-            arg.sort()
-        else:
-            match arg:
-                case "":
-                    print(f"Argument has 0 items")
-                case _:
-                    raise TypeError("Argument should be a list or an empty string. Are databases created?")
+        if not isinstance(arg, (list, set, frozenset)):
+            raise TypeError("Argument should be a list or a set. Are databases created?")
+
+    # hash the smallest database first, the others are only probed against it
+    smallest, *others = sorted(args, key=len)
+
+    return list(set(smallest).intersection(*others))
+
+
+_LISTING_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'hidrocl')
+_CREATED_DIRS = set()
 
-    indb = [set(value) for value in args]
 
-    return list(reduce((lambda x, y: x & y), indb))
+def _listdir_cached(productpath):
+    """
+    List a product folder, reusing the listing saved in the user cache
+    while the folder modification time has not changed
+
+    :param productpath: str with product path
+    :return: list with names of the files in the folder
+    """
+    mtime = os.stat(productpath).st_mtime_ns
+    cache = os.path.join(_LISTING_CACHE,
+                         hashlib.sha1(os.path.abspath(productpath).encode()).hexdigest() + '.pkl')
+    try:
+        with open(cache, 'rb') as f:
+            cached_mtime, names = pickle.load(f)
+        if cached_mtime == mtime:
+            return names
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    # the entry type comes from the listing itself, so no file is stat'ed
+    with os.scandir(productpath) as entries:
+        names = [entry.name for entry in entries if entry.is_file()]
+
+    # a folder modified in the last seconds may change again without a new mtime
+    if time.time_ns() - mtime > 2_000_000_000:
+        try:
+            if _LISTING_CACHE not in _CREATED_DIRS:
+                os.makedirs(_LISTING_CACHE, exist_ok=True)
+                _CREATED_DIRS.add(_LISTING_CACHE)
+            tmp = f'{cache}.{os.getpid()}'
+            with open(tmp, 'wb') as f:
+                pickle.dump((mtime, names), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+
+    return names
 
 
 def read_product_files(productpath, what="modis", variable = None):
@@ -39,35 +86,70 @@ def read_product_files(productpath, what="modis", variable = None):
     """
     match what:
         case "modis":
-            return [value for value in os.listdir(productpath) if ".hdf" in value]
+            return [value for value in _listdir_cached(productpath) if ".hdf" in value]
         case "imerg":
-            return [value for value in os.listdir(productpath) if ".HDF5" in value]
+            return [value for value in _listdir_cached(productpath) if ".HDF5" in value]
         case "imgis":
-            return [value for value in os.listdir(productpath) if ".tif" in value]
+            return [value for value in _listdir_cached(productpath) if ".tif" in value]
         case "gldas":
-            return [value for value in os.listdir(productpath) if ".nc4" in value]
+            return [value for value in _listdir_cached(productpath) if ".nc4" in value]
         case "gfs":
             if variable:
-                return [str(value.relative_to(productpath)) for value in Path(productpath).rglob('*_'+variable+'_*.nc')]
+                return _walk_product_files(productpath, '_'+variable+'_', '.nc')
             else:
                 print('Variable not defined')
                 return None
         case "persiann_ccs_cdr":
-            return [value for value in os.listdir(productpath) if "PCCSCDR" in value
+            return [value for value in _listdir_cached(productpath) if "PCCSCDR" in value
                     and ".bin" in value and ".gz" not in value]
         case "persiann_ccs":
-            return [value for value in os.listdir(productpath) if "rgccs" in value
+            return [value for value in _listdir_cached(productpath) if "rgccs" in value
                     and ".bin" in value and ".gz" not in value]
         case "pdirnow":
-            return [value for value in os.listdir(productpath) if "pdirnow" in value
+            return [value for value in _listdir_cached(productpath) if "pdirnow" in value
                     and ".bin" in value and ".gz" not in value]
         case "era5":
-            return [value for value in os.listdir(productpath) if ".nc" in value]
+            return [value for value in _listdir_cached(productpath) if ".nc" in value]
         case _:
             print("Unknown product type")
             return None
 
 
+def _walk_product_files(productpath, contains, extension):
+    """
+    List files under productpath, relative to it, whose name contains
+    a string and ends with an extension
+
+    :param productpath: str with product path
+    :param contains: str that file names should contain before the extension
+    :param extension: str with file extension
+    :return: list with relative file paths
+    """
+    files = []
+    _scan_product_files(productpath, contains, extension, len(os.path.join(productpath, '')), files)
+    return files
+
+
+def _scan_product_files(folder, contains, extension, strip, files):
+    """
+    Recursively scan a folder with os.scandir, adding matching files to files.
+    The entry type comes from the directory listing itself, so no file is stat'ed
+
+    :param folder: str with folder path
+    :param contains: str that file names should contain before the extension
+    :param extension: str with file extension
+    :param strip: int with the length of the root prefix to remove from paths
+    :param files: list to append relative file paths to
+    :return: None
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scan_product_files(entry.path, contains, extension, strip, files)
+            elif entry.name.endswith(extension) and contains in entry.name[:-len(extension)]:
+                files.append(entry.path[strip:])
+
+
 def get_product_ids(product_files, what="modis"):
     """
     Get product IDs from product files
@@ -115,7 +197,8 @@ def count_scenes_occurrences(all_scenes, product_ids):
     :param product_ids: list with product IDs
     :return: dictionary with product IDs and number of occurrences
     """
-    return {value: product_ids.count(value) for value in all_scenes}
+    counts = Counter(product_ids)
+    return {value: counts[value] for value in all_scenes}
 
 
 def classify_occurrences(scenes_occurrences, what="modis"):
@@ -205,21 +288,154 @@ def get_scenes_out_of_db(complete_scenes, common_elements, what='modis'):
             return lst
 
 
+class _ThreadFilteredStream:
+    """
+    Stream wrapper that drops what is written from threads inside HiddenPrints
+    and passes everything else to the wrapped stream.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        if getattr(HiddenPrints._local, 'depth', 0):
+            return len(text)
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 class HiddenPrints:
     """
     Context manager to suppress stdout and stderr.
+
+    Only output from the thread inside the context is suppressed, so scenes
+    extracted by worker threads do not silence each other. sys.stdout and
+    sys.stderr are wrapped when the first thread enters and restored when
+    the last one leaves.
+    """
+    _lock = threading.Lock()
+    _local = threading.local()
+    _users = 0
+    _original_stdout = None
+    _original_stderr = None
+
+    def __enter__(self):
+        cls = HiddenPrints
+        with cls._lock:
+            if cls._users == 0:
+                cls._original_stdout = sys.stdout
+                cls._original_stderr = sys.stderr
+                sys.stdout = _ThreadFilteredStream(sys.stdout)
+                sys.stderr = _ThreadFilteredStream(sys.stderr)
+            cls._users += 1
+        cls._local.depth = getattr(cls._local, 'depth', 0) + 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cls = HiddenPrints
+        cls._local.depth -= 1
+        with cls._lock:
+            cls._users -= 1
+            if cls._users == 0:
+                sys.stdout = cls._original_stdout
+                sys.stderr = cls._original_stderr
+
+
+class SceneExecutor:
     """
+    Context manager to run the extraction of scenes.
+
+    With one worker each submitted call runs right away in this process,
+    as a plain loop would. With more workers calls go to a process pool,
+    or to a thread pool if threads is True, and on exit the context waits
+    for all of them and raises the first error found. Threads avoid
+    pickling arguments and most of the time is spent in R and GDAL,
+    outside the GIL. If workers is None one worker per core is used.
+
+    With more than one worker the cores are shared among them, setting
+    GDAL_NUM_THREADS for the workers unless it is already set, so GDAL
+    does not start a thread per core in every worker.
+    """
+    def __init__(self, workers=1, threads=False):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.threads = threads
+        self._executor = None
+        self._futures = []
+        self._set_gdal_threads = False
+
     def __enter__(self):
-        self._original_stdout = sys.stdout
-        self._original_stderr = sys.stderr
-        sys.stdout = open(os.devnull, 'w')
-        sys.stderr = open(os.devnull, 'w')
+        if self.workers > 1:
+            gdal_threads = str(max(1, (os.cpu_count() or 1) // self.workers))
+            if self.threads:
+                # threads share the environment, so it is restored on exit
+                if 'GDAL_NUM_THREADS' not in os.environ:
+                    os.environ['GDAL_NUM_THREADS'] = gdal_threads
+                    self._set_gdal_threads = True
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     initializer=_init_gdal_threads,
+                                                     initargs=(gdal_threads,))
+        return self
+
+    def submit(self, fn, *args, **kwargs):
+        if self._executor is None:
+            fn(*args, **kwargs)
+        else:
+            self._futures.append(self._executor.submit(fn, *args, **kwargs))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stdout.close()
-        sys.stderr.close()
-        sys.stdout = self._original_stdout
-        sys.stderr = self._original_stderr
+        if self._executor is not None:
+            try:
+                self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            finally:
+                if self._set_gdal_threads:
+                    del os.environ['GDAL_NUM_THREADS']
+                    self._set_gdal_threads = False
+            if exc_type is None:
+                for future in self._futures:
+                    future.result()
+
+
+def _init_gdal_threads(gdal_threads):
+    """
+    Set GDAL_NUM_THREADS in a worker process of SceneExecutor, unless it is
+    already set
+
+    :param gdal_threads: str with the number of GDAL threads per worker
+    :return: None
+    """
+    os.environ.setdefault('GDAL_NUM_THREADS', gdal_threads)
+
+
+@lru_cache(maxsize=None)
+def vector_bounds(vector_path):
+    """
+    Read the bounding box of a shapefile from its header, without loading
+    the geometries
+
+    :param vector_path: str with vector path
+    :return: tuple with minx, miny, maxx and maxy, or None if it is not a shapefile
+    """
+    if vector_path is None or not str(vector_path).lower().endswith('.shp'):
+        return None
+    with open(vector_path, 'rb') as f:
+        header = f.read(100)
+    return struct.unpack('<4d', header[36:68])
+
+
+def make_scratch_dir(owner):
+    """
+    Create a temporary folder that lives as long as owner, so repeated
+    extractions reuse it. It is removed when owner is garbage collected
+    or when the interpreter exits
+
+    :param owner: object the folder belongs to
+    :return: str with the folder path
+    """
+    path = tempfile.mkdtemp(prefix="hidrocl_")
+    weakref.finalize(owner, shutil.rmtree, path, ignore_errors=True)
+    return path
 
 
 def get_scenes_path(product_files, productpath):
@@ -233,6 +449,73 @@ def get_scenes_path(product_files, productpath):
     return [os.path.join(productpath, value) for value in product_files]
 
 
+def get_scenes_files(scenes_path, product_ids):
+    """
+    Group scenes path by product ID, so the files of a scene are
+    found without scanning every product file
+
+    :param scenes_path: list with scenes path
+    :param product_ids: list with the product ID of each path
+    :return: dict with product IDs as keys and lists of scenes path as values
+    """
+    scenes_files = {}
+    for path, product_id in zip(scenes_path, product_ids):
+        scenes_files.setdefault(product_id, []).append(path)
+    return scenes_files
+
+
+def select_scenes_path(scenes_files, scenes):
+    """
+    Get the scenes path of several scenes
+
+    :param scenes_files: dict with scenes path by product ID
+    :param scenes: list with scenes to select
+    :return: list with scenes path
+    """
+    return [path for scene in scenes for path in scenes_files[scene]]
+
+
+class ProductCatalog:
+    """
+    Files, IDs and scenes classification of a product folder.
+
+    Use ProductCatalog.get to build it: product classes reading the same
+    folder share one catalog while the folder modification time does not change.
+    """
+    _catalogs = {}
+
+    def __init__(self, productpath, what="modis", variable=None):
+        self.product_files = read_product_files(productpath, what, variable=variable)
+        self.product_ids = get_product_ids(self.product_files, what)
+        self.all_scenes = check_product_files(self.product_ids)
+        self.scenes_occurrences = count_scenes_occurrences(self.all_scenes, self.product_ids)
+        (self.overpopulated_scenes,
+         self.complete_scenes,
+         self.incomplete_scenes) = classify_occurrences(self.scenes_occurrences, what)
+        self.scenes_path = get_scenes_path(self.product_files, productpath)
+        self.scenes_files = get_scenes_files(self.scenes_path, self.product_ids)
+
+    @classmethod
+    def get(cls, productpath, what="modis", variable=None):
+        """
+        Get the catalog of a product folder, reusing the last one built for it
+
+        :param productpath: str with product path
+        :param what: str with product type
+        :param variable: str with variable name (only for gfs)
+        :return: ProductCatalog
+        """
+        if what == "gfs":
+            # gfs files are nested in subfolders, the root mtime does not track them
+            return cls(productpath, what, variable)
+        key = (os.path.abspath(productpath), what, variable)
+        mtime = os.stat(productpath).st_mtime_ns
+        cached = cls._catalogs.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = cls._catalogs[key] = (mtime, cls(productpath, what, variable))
+        return cached[1]
+
+
 def check_instance(*args):
     """
     Check if arguments are instances of HidroCLVariable
@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import os
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 from . import methods
@@ -18,7 +19,7 @@ class HidroCLVariable:
         name (str): Name of the variable
         database (str): Path to the database
         pcdatabase (str): Path to the database with pixel count
-        indatabase (list): List of IDs in the database
+        indatabase (set): Set of IDs in the database
         observations (pandas.DataFrame): Dataframe with the observations
         pcobservations (pandas.DataFrame): Dataframe with the pixel count
         catchment_names (list): List of catchment names
@@ -34,10 +35,11 @@ class HidroCLVariable:
         self.name = name
         self.database = database
         self.pcdatabase = pcdatabase
-        self.indatabase = ''
+        self.indatabase = set()
         self.observations = None
         self.pcobservations = None
         self.catchment_names = None
+        self._db_stat = None
         self.checkdatabase()
         self.checkpcdatabase()
 
@@ -64,32 +66,61 @@ Database path: {self.database}.
 Pixel count database path: {self.pcdatabase}.
         '''
 
-    def checkindatabase(self):
+    def checkindatabase(self, verbose=True):
         """
         Check IDs in database
 
+        Args:
+            verbose (bool): print a message if the database has not been checked
+
         Returns:
-            list: List of IDs in the database
+            set: Set of IDs in the database
         """
         if self.observations is None:
-            print('Please, check the database for getting the IDs processed')
-            return ''
+            if verbose:
+                print('Please, check the database for getting the IDs processed')
+            return set()
         else:
-            return [str(i) for i in self.observations[self.observations.columns[0]].values.tolist()]
+            return {str(i) for i in self.observations[self.observations.columns[0]].values.tolist()}
 
-    def checkdatabase(self):
+    def checkdatabase(self, verbose=True):
         """
         Check database
 
+        Args:
+            verbose (bool): print what is being done with the database
+
         Returns:
             pandas.DataFrame: Dataframe with the observations
         """
-        self.observations = methods.checkdatabase(self.database, self.catchment_names)
-        self.indatabase = self.checkindatabase()
+        # the database is only read again if it changed since the last check.
+        # It is stat'ed before reading, so lines appended meanwhile are read next time
+        db_stat = self._database_stat()
+        if self.observations is not None and db_stat is not None and db_stat == self._db_stat:
+            if verbose:
+                print('Database unchanged, using ' + self.database)
+            return
+        self.observations = methods.checkdatabase(self.database, self.catchment_names, verbose=verbose)
+        self.indatabase = self.checkindatabase(verbose=verbose)
+        self._db_stat = db_stat if self.observations is not None else None
         try:
             self.catchment_names = self.observations.columns[1:].tolist()
         except AttributeError:
-            print('Could not load dataframe, perhaps the database has not been created yet')
+            if verbose:
+                print('Could not load dataframe, perhaps the database has not been created yet')
+
+    def _database_stat(self):
+        """
+        Modification time and size of the database, or None if it does not exist
+
+        Returns:
+            tuple: modification time in nanoseconds and size in bytes
+        """
+        try:
+            st = os.stat(self.database)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def checkpcdatabase(self):
         """
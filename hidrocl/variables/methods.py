@@ -5,33 +5,38 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 
-def checkdatabase(database, catchment_names=None):
+def checkdatabase(database, catchment_names=None, verbose=True):
     """
     Check if the database exists and is valid
 
     :param database: str with the path to the database
     :param catchment_names: list with the catchment names
+    :param verbose: bool, print what is being done with the database
     :return: pandas.DataFrame with the observations
     """
 
     if os.path.exists(database):  # check if db exists
-        print('Database found, using ' + database)
+        if verbose:
+            print('Database found, using ' + database)
         observations = pd.read_csv(database, dtype={'name_id':str})
         observations.date = pd.to_datetime(observations.date, format='%Y-%m-%d')
         observations.set_index(['date'], inplace=True)
         return observations
     else:  # create db
         if catchment_names is None:
-            print('Database not found. Please, add catchment names before creating the database')
+            if verbose:
+                print('Database not found. Please, add catchment names before creating the database')
         else:
-            print('Database not found, creating it for ' + database)
+            if verbose:
+                print('Database not found, creating it for ' + database)
             header_line = [str(s) for s in catchment_names]
             header_line.insert(0, 'name_id')
             header_line.insert(1, 'date')
             header_line = ','.join(header_line) + '\n'
             with open(database, 'w') as the_file:
                 the_file.write(header_line)
-            print('Database created!')
+            if verbose:
+                print('Database created!')
             observations = pd.read_csv(database)
             observations.date = pd.to_datetime(observations.date, format='%Y-%m-%d')
             observations.set_index(['date'], inplace=True)
@@ -1,10 +1,11 @@
-import os
 import hidrocl
 import pandas as pd
 import hidrocl_paths as hcl
 
 fpath = hcl.imerggis_path
 
+downloaded_files = hidrocl.download.list_downloaded(fpath, '.tif')
+
 start = '2000-01-01'
 end = '2022-10-01'
 
@@ -13,17 +14,8 @@ period = pd.period_range(pd.to_datetime(start, format="%Y-%m-%d"),
 
 for date in period:
     try:
-        files = hidrocl.download.get_imerg(str(date), str(date), 'hidrocl@meteo.uv.cl','hidrocl@meteo.uv.cl', timeout=120)
+        hidrocl.download.bulk_download_imerg(str(date), str(date), fpath,
+                                             'hidrocl@meteo.uv.cl', 'hidrocl@meteo.uv.cl',
+                                             timeout=120, downloaded=downloaded_files)
     except:
         continue
-
-    downloaded_files = os.listdir(fpath)
-
-    files = [val for val in files if not val.split('/')[-1] in downloaded_files]
-
-    for file in files:
-        try:
-            hidrocl.download.download_imerg(file, fpath, 'hidrocl@meteo.uv.cl', 'hidrocl@meteo.uv.cl', timeout=120)
-        except:
-            print('Error downloading file: ', file)
-            continue
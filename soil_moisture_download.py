@@ -1,13 +1,12 @@
 # coding=utf-8
 
 
-import os
 import hidrocl
 import pandas as pd
 import hidrocl_paths as hcl
 
-files = os.listdir(hcl.satellite_soil_moisture)
-files = list(set([file.split('-')[6][:8] for file in files]))
+files = hidrocl.download.list_downloaded(hcl.satellite_soil_moisture)
+files = {file.split('-')[6][:8] for file in files}
 
 start = '2000-01-01'
 end = '2022-10-01'